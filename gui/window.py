@@ -17,11 +17,18 @@
 
 import os
 import sys
+import time
+from functools import cache, lru_cache
 from typing import Dict
 
-from PyQt5.QtCore import Qt, QUrl
-from PyQt5.QtGui import QPixmap, QFont
-from PyQt5.QtWebEngineWidgets import QWebEngineView
+import numpy as np
+from PyQt5.QtCore import (
+    Qt, QLocale, QSettings, QSize, QStringListModel, QTimer, QUrl,
+    QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, pyqtSignal,
+)
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QFont, QFontDatabase, QDoubleValidator
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineProfile
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -31,26 +38,352 @@ from PyQt5.QtWidgets import (
     QLabel,
     QPushButton,
     QComboBox,
-    QTextEdit,
+    QPlainTextEdit,
     QMessageBox,
     QSplitter,
     QTabWidget,
     QDialog,
     QListWidget,
+    QListWidgetItem,
     QLineEdit,
     QFormLayout,
     QDialogButtonBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QProgressBar,
     QSizePolicy,
+    QCheckBox,
+    QCompleter,
 )
 
 from src.models.location import Location
-from src.utils.benchmark import benchmark_algorithms
-from src.utils.geocoding import Geocoder
-from geopy.distance import geodesic
-import matplotlib.pyplot as plt
+from src.models.run_result import RunResult
+from src.utils.geocoding import Geocoder, normalize_query
+from src.utils.map_renderer import BUNDLED_ORS_KEY, ORS_KEY
+
+# matplotlib (pulled in by the charts and src.utils.benchmark) costs hundreds of
+# ms to import and is only needed for the graphs, so it is imported inside
+# the methods that plot. QtWebEngineWidgets stays above: Qt requires it to
+# be imported before the QApplication is created.
+
+# Successful lookups persist here so repeat addresses skip ORS across runs
+GEOCODE_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "delivery-optimizer", "geocode.sqlite3"
+)
+
+# ORS free plan allows 100 geocode requests / minute
+ORS_GEOCODE_MIN_INTERVAL = 0.6
+
+# One Geocoder for the whole session so its lookup cache is shared by
+# every LocationManagerDialog.
+_GEOCODER: Geocoder | None = None
+
+
+def _get_geocoder() -> Geocoder:
+    global _GEOCODER
+    if _GEOCODER is None:
+        # ORS_KEY is resolved in src.utils.map_renderer (the ORS_KEY
+        # environment variable overrides the bundled one); warned about
+        # here, when the first lookup needs it, not on import
+        if ORS_KEY is BUNDLED_ORS_KEY:
+            print("WARNING: ORS_KEY not set, using the bundled (shared, rate-limited) ORS key")
+        _GEOCODER = Geocoder(ORS_KEY, cache_path=GEOCODE_CACHE_PATH,
+                             min_interval=ORS_GEOCODE_MIN_INTERVAL)
+    return _GEOCODER
+
+
+# Bulk lookups get their own small pool: enough parallelism to overlap
+# round-trips without bursting past the ORS per-minute quota, and it
+# leaves the global pool free for benchmarks / single lookups.
+_BULK_GEOCODE_THREADS = 4
+_BULK_POOL: QThreadPool | None = None
+
+
+def _get_bulk_pool() -> QThreadPool:
+    global _BULK_POOL
+    if _BULK_POOL is None:
+        _BULK_POOL = QThreadPool()
+        _BULK_POOL.setMaxThreadCount(_BULK_GEOCODE_THREADS)
+    return _BULK_POOL
+
+
+# Road-path fetches (ORS directions) get their own single thread: they are
+# optional and can wait on the network, so they must never hold a thread
+# of the global pool that runs, benchmarks, geocoding and image decodes share.
+_ROAD_POOL: QThreadPool | None = None
+
+
+def _get_road_pool() -> QThreadPool:
+    global _ROAD_POOL
+    if _ROAD_POOL is None:
+        _ROAD_POOL = QThreadPool()
+        _ROAD_POOL.setMaxThreadCount(1)
+    return _ROAD_POOL
+
+
+# Files next to this module, resolved once at import
+GUI_DIR = os.path.dirname(os.path.abspath(__file__))
+LOGO_PATH = os.path.join(GUI_DIR, "logo.png")
+COMPARISON_PNG = os.path.join(GUI_DIR, "current_comparison.png")
+EXECUTION_TIME_PNG = os.path.join(GUI_DIR, "execution_time.png")
+EXECUTION_DISTANCE_PNG = os.path.join(GUI_DIR, "execution_distance.png")
+
+
+@cache
+def _logo_pixmap() -> QPixmap:
+    # Header logo, decoded once per process at its display size and shared
+    # by every MainWindow. Lazy because QPixmap needs a QApplication to exist.
+    # Kept synchronous (it is part of the first paint); decoding straight
+    # to 200x180 makes that cheap.
+    # Returns a null pixmap if the file could not be loaded.
+    reader = QImageReader(LOGO_PATH)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(200, 180, Qt.KeepAspectRatio))
+    return QPixmap.fromImage(reader.read())
+
+
+def _image_mtime(path: str) -> int | None:
+    # File mtime in ns, or None if the file does not exist.
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _pixmap_from_rgba(rgba, width: int) -> QPixmap:
+    # Scaled pixmap straight from an (H, W, 4) uint8 array, e.g. a matplotlib
+    # canvas buffer: no PNG encode / decode in between.
+    h, w = rgba.shape[:2]
+    image = QImage(rgba.data, w, h, 4 * w, QImage.Format_RGBA8888)
+    # fromImage copies the pixels, so rgba need not outlive this call
+    pixmap = QPixmap.fromImage(image)
+    if w == width:
+        return pixmap  # rendered at display size, nothing to resample
+    return pixmap.scaledToWidth(width, Qt.FastTransformation)
+
+
+@lru_cache(maxsize=32)
+def _load_scaled_image(path: str, mtime: int, width: int) -> QImage:
+    # Decode a PNG directly at the given width (QImageReader scales while
+    # decoding, so no full-size image and no separate resample pass).
+    # Returns a QImage, not a QPixmap, so it can run on a pool thread.
+    #
+    # Keyed on the file's mtime: showing the same graph again skips the
+    # decode, while a re-generated file is picked up automatically.
+    # Bounded and shared by every window: superseded mtimes age out
+    # instead of accumulating for the life of the process.
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid() and size.width() > 0 and size.width() != width:
+        height = round(size.height() * width / size.width())
+        reader.setScaledSize(QSize(width, height))
+    return reader.read()
+
+
+# Simple professional light theme, parsed and applied once per MainWindow.
+# Individual widgets are styled through their objectName (#Name rules
+# below) rather than inline setStyleSheet calls, so the whole window costs
+# a single stylesheet parse.
+_MAIN_QSS = """
+QMainWindow {
+    background-color: #eeeeee;
+}
+
+QTabBar::tab {
+    padding: 6px 16px;
+    font-weight: 500;
+}
+
+QTabBar::tab:selected {
+    background-color: #ffffff;
+    border-bottom: 2px solid #3f51b5;
+}
+
+QLabel#MainTitle {
+    font-size: 22px;
+    font-weight: 700;
+}
+
+QPushButton {
+    background-color: #3f51b5;
+    color: white;
+    border-radius: 4px;
+    padding: 6px;
+}
+
+QPushButton:hover {
+    background-color: #5c6bc0;
+}
+
+QPushButton:disabled {
+    background-color: #b0bec5;
+}
+
+QPlainTextEdit#OutputBox {
+    background-color: #ffffff;
+    border: 1px solid #d0d0d0;
+    border-radius: 4px;
+}
+
+QLabel#AppTitle {
+    color: #2E86C1;
+}
+
+QLabel#SectionLabel {
+    font-weight: bold;
+    font-size: 18px;
+}
+
+QLabel#PanelTitle {
+    font-weight: bold;
+    margin-top: 4px;
+}
+
+QLabel#TabDescription, QCheckBox#TabOption {
+    font-size: 18px;
+}
+
+QLabel#MetricsPanel {
+    background-color: #E8F1FA;
+    border: 1px solid #cccccc;
+    border-radius: 4px;
+    padding: 6px;
+    font-size: 18px;
+}
+
+QLabel#ComparisonPreview {
+    background-color: #fafafa;
+    border: 1px solid #cccccc;
+    border-radius: 0px;
+}
+
+#MapFrame {
+    border: 1px solid #cccccc;
+    background-color: white;
+}
+
+QComboBox#AlgoSelect {
+    background-color: lightgray;
+    height: 25px;
+}
+
+QProgressBar#MapProgress {
+    margin: 0px;
+    padding: 0px;
+}
+
+QPushButton#ActionButton {
+    font-size: 18px;
+    background-color: steelblue;
+}
+
+QPushButton#SecondaryButton {
+    font-size: 18px;
+    background-color: lightblue;
+}
+"""
+
+
+@cache
+def _map_profile() -> QWebEngineProfile:
+    # Off-the-record profile (no storage name) shared by the map views.
+    # The map HTML is regenerated locally on every run, so an on-disk HTTP
+    # cache and persistent cookies only add I/O at load and shutdown.
+    # Parented to the QApplication so it outlives every page using it.
+    profile = QWebEngineProfile(QApplication.instance())
+    profile.setHttpCacheType(QWebEngineProfile.MemoryHttpCache)
+    profile.setPersistentCookiesPolicy(QWebEngineProfile.NoPersistentCookies)
+    return profile
+
+
+# Base URL for map HTML passed to setHtml. Only used as the page origin;
+# nothing is read from or written to this path.
+_MAP_BASE_URL = QUrl.fromLocalFile(os.path.abspath("nearest_delivery.html"))
+
+
+# =====================================================================
+# Background tasks
+# =====================================================================
+
+class BackgroundTaskSignals(QObject):
+    # Signals for BackgroundTask.
+    #
+    # QRunnable is not a QObject, so it cannot own signals itself.
+    # Emitting from the worker thread queues the call onto the GUI thread,
+    # so connected slots are free to touch widgets.
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int, int)  # (done, total)
+
+
+class BackgroundTask(QRunnable):
+    # Runs fn(*args, **kwargs) on a QThreadPool thread and reports back via signals.
+    #
+    # Used for blocking work (network lookups, benchmarks, ...) that would
+    # otherwise freeze the Qt event loop.
+    # With with_progress=True, fn also receives progress=<callable(done, total)>
+    # which forwards to signals.progress.
+
+    def __init__(self, fn, *args, with_progress: bool = False, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = BackgroundTaskSignals()
+        if with_progress:
+            self.kwargs["progress"] = self.signals.progress.emit
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+# =====================================================================
+# Distance matrix model
+# =====================================================================
+
+class DistanceMatrixModel(QAbstractTableModel):
+    # Read-only table model over an (n, n) NumPy distance matrix in km.
+    #
+    # Cells are formatted on demand when the view paints them, so a refresh
+    # is one model reset instead of n² QTableWidgetItem allocations (each
+    # with its own change signal and relayout).
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: list = []
+        self._dist_km = None
+
+    def set_matrix(self, names: list, dist_km):
+        # Replace the whole matrix; names label both rows and columns.
+        self.beginResetModel()
+        self._names = list(names)
+        self._dist_km = dist_km
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return f"{self._dist_km[index.row(), index.column()]:.3f}"
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and 0 <= section < len(self._names):
+            return self._names[section]
+        return None
+
+    def flags(self, index):
+        # Selectable but not editable, like the old read-only items
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
 
 
 # =====================================================================
@@ -64,15 +397,46 @@ class LocationManagerDialog(QDialog):
     # - Shows existing locations in a list.
     # - Allows deletion of non-depot locations.
     # - Allows adding a new location using:
-    #     - Address/postcode search (via geopy Nominatim)
+    #     - Address/postcode search (via ORS geocoding, see Geocoder)
     #     - Name, latitude, longitude fields
+    # - Bulk add: one address per line, geocoded in parallel.
+    # - Address suggestions while typing (ORS autocomplete).
     #
-    # The dialog directly modifies the locations dict passed in.
+    # Edits are made on a working copy. Only when OK is pressed is the
+    # minimal delta published, one locationRemoved / locationAdded signal
+    # per changed name, so Cancel leaves the controller's locations untouched
+    # and listeners can apply (or persist) single changes.
+
+    # The dialog is built once per MainWindow and reused: call reset() before
+    # each exec_() to start from the controller's current locations.
+
+    # Names that cannot be deleted; their rows are shown but not selectable
+    _PROTECTED = frozenset({"Depot"})
+
+    # (title, text) of the fixed warnings, kept together for wording / i18n
+    _MSG_NO_QUERY = ("No input", "Please enter a postcode or location.")
+    _MSG_NO_BULK_INPUT = ("No input", "Please enter at least one new address.")
+    _MSG_NOT_FOUND = ("Not found",
+                      "ORS could not find a match for that text.\n"
+                      "Try a more specific address or postcode.")
+    _MSG_NAME_EXISTS = ("Name exists", "That name already exists.")
+    _MSG_INVALID_COORDS = ("Invalid",
+                           "Latitude must be in [-90, 90] and Longitude in [-180, 180].")
+
+    locationAdded = pyqtSignal(object)   # Location
+    locationRemoved = pyqtSignal(str)    # name
 
     def __init__(self, locations: Dict[str, Location], parent=None):
         super().__init__(parent)
         self.setWindowTitle("Manage Locations")
-        self.locations = locations  # shared with controller
+        self._committed = locations          # controller's dict, read-only here
+        self.locations = dict(locations)     # working copy edited by the dialog
+
+        # Names published by accept()
+        self.added: list[str] = []
+        self.removed: list[str] = []
+        # Whether the working copy was touched at all since the last reset
+        self._edited = False
 
         # Widgets we need later
         self.list_widget = None
@@ -80,6 +444,28 @@ class LocationManagerDialog(QDialog):
         self.name_edit = None
         self.lat_edit = None
         self.lon_edit = None
+        self.search_button = None
+        self.bulk_edit = None
+        self.bulk_button = None
+
+        # Geocoding runs on a worker thread; keep the task (and the query it
+        # was started for) alive until its signals have fired.
+        self._geocode_task = None
+        self._geocode_query = ""
+
+        # Autocomplete: debounce timer, suggestion model and in-flight fetch
+        self._suggest_timer: QTimer | None = None
+        self._suggest_model: QStringListModel | None = None
+        self._suggest_task = None
+
+        # In-flight bulk lookups keyed by query, plus the ones that failed.
+        # Each batch is tagged with the session it was started in; reset()
+        # and accept() end the session, and late results of an ended one
+        # are dropped (their tasks are parked until they report back).
+        self._bulk_tasks: Dict[str, BackgroundTask] = {}
+        self._bulk_failed: list[str] = []
+        self._bulk_session = 0
+        self._stale_bulk_tasks: set = set()
 
         self._build_ui()      # all the layout / widgets go here
         self.refresh_list()   # populate the list once
@@ -100,19 +486,44 @@ class LocationManagerDialog(QDialog):
         self.search_edit = QLineEdit()
         form_layout.addRow("Address / Postcode:", self.search_edit)
 
-        search_button = QPushButton("Search address/postcode")
-        search_button.clicked.connect(self.lookup_address)
-        form_layout.addRow("", search_button)
+        # Suggestions are fetched 300 ms after the last keystroke. Picking one
+        # makes the following Search instant: its coordinates came with it.
+        self._suggest_model = QStringListModel(self)
+        completer = QCompleter(self._suggest_model, self)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)  # ORS labels may reorder the words
+        self.search_edit.setCompleter(completer)
+
+        self._suggest_timer = QTimer(self)
+        self._suggest_timer.setSingleShot(True)
+        self._suggest_timer.setInterval(300)
+        self._suggest_timer.timeout.connect(self._request_suggestions)
+        self.search_edit.textEdited.connect(lambda _text: self._suggest_timer.start())
+
+        self.search_button = QPushButton("Search address/postcode")
+        self.search_button.clicked.connect(self.lookup_address)
+        form_layout.addRow("", self.search_button)
 
         self.name_edit = QLineEdit()
-        self.lat_edit = QLineEdit()
-        self.lon_edit = QLineEdit()
+        self.lat_edit = self._coordinate_edit(-90.0, 90.0)
+        self.lon_edit = self._coordinate_edit(-180.0, 180.0)
         form_layout.addRow("Name:", self.name_edit)
         form_layout.addRow("Latitude:", self.lat_edit)
         form_layout.addRow("Longitude:", self.lon_edit)
 
         main_layout.addLayout(form_layout)
 
+        # --- Bulk add --------------------------------------------------
+        main_layout.addWidget(QLabel("Bulk add (one address / postcode per line):"))
+
+        self.bulk_edit = QPlainTextEdit()
+        self.bulk_edit.setFixedHeight(80)
+        main_layout.addWidget(self.bulk_edit)
+
+        self.bulk_button = QPushButton("Geocode all")
+        self.bulk_button.clicked.connect(self.geocode_bulk)
+        main_layout.addWidget(self.bulk_button)
+
         # --- Delete button ---------------------------------------------
         delete_button = QPushButton("Delete selected (non-Depot)")
         delete_button.clicked.connect(self.delete_selected)
@@ -124,87 +535,282 @@ class LocationManagerDialog(QDialog):
         buttons.rejected.connect(self.reject)
         main_layout.addWidget(buttons)
 
+    def _coordinate_edit(self, bottom: float, top: float) -> QLineEdit:
+        # Line edit that only accepts numbers in [bottom, top].
+        # A geocoded value is kept as a float in the "value" property so
+        # accept() need not re-parse it; typing into the field drops it.
+        edit = QLineEdit()
+        validator = QDoubleValidator(bottom, top, 8, edit)
+        validator.setNotation(QDoubleValidator.StandardNotation)
+        validator.setLocale(QLocale.c())  # "." decimal point, as float() expects
+        edit.setValidator(validator)
+        edit.textEdited.connect(lambda _text: edit.setProperty("value", None))
+        return edit
+
+    @staticmethod
+    def _coordinate(edit: QLineEdit) -> float:
+        # Float in a coordinate edit; raises ValueError if empty / incomplete.
+        value = edit.property("value")
+        if value is not None:
+            return value
+        if edit.hasAcceptableInput():
+            return float(edit.text())
+        raise ValueError(edit.text())
+
+    # ------------------------------------------------------------------
+    def reset(self, locations: Dict[str, Location]):
+        # Start a fresh editing session on a reused dialog.
+        # Only the list rows that differ are touched (see refresh_list).
+        self._committed = locations
+        self.locations = dict(locations)
+        self.added = []
+        self.removed = []
+        self._edited = False
+
+        for edit in (self.search_edit, self.name_edit, self.lat_edit, self.lon_edit):
+            edit.clear()
+        self.lat_edit.setProperty("value", None)
+        self.lon_edit.setProperty("value", None)
+        self._suggest_model.setStringList([])
+
+        self._end_bulk_session()
+        self.bulk_edit.clear()
+
         self.refresh_list()
 
     # ------------------------------------------------------------------
     def refresh_list(self):
-        # Refresh the list widget from current locations dict.
-        self.list_widget.clear()
-        for name in self.locations.keys():
-            self.list_widget.addItem(name)
+        # Sync the list widget with the current locations dict.
+        # Only the difference is applied (nothing at all if already in sync),
+        # with repaints and signals suspended so it costs one layout pass.
+        existing = {self.list_widget.item(i).data(Qt.UserRole): i
+                    for i in range(self.list_widget.count())}
+        stale = sorted((i for name, i in existing.items() if name not in self.locations),
+                       reverse=True)
+        missing = [name for name in self.locations if name not in existing]
+        if not stale and not missing:
+            return
+
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            # Highest index first so earlier rows keep their positions
+            for i in stale:
+                self.list_widget.takeItem(i)
+            for name in missing:
+                self.list_widget.addItem(self._make_item(name))
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
+
+    def _make_item(self, name: str) -> QListWidgetItem:
+        # Row for one location. The dict key lives in Qt.UserRole, so the
+        # displayed text is free to differ from it.
+        item = QListWidgetItem(name)
+        item.setData(Qt.UserRole, name)
+        if name in self._PROTECTED:
+            item.setFlags(item.flags() & ~Qt.ItemIsEnabled)
+        return item
 
     # ------------------------------------------------------------------
     def delete_selected(self):
-        # Delete the currently selected location (but not Depot).
+        # Delete the currently selected location.
+        # Protected rows (Depot) are disabled in the list, so they can never
+        # be the current item; the check below is just a safety net.
         item = self.list_widget.currentItem()
-        if not item:
+        if not item or item.data(Qt.UserRole) in self._PROTECTED:
             return
 
-        name = item.text()
-        if name == "Depot":
-            QMessageBox.warning(self, "Not allowed", "You cannot delete the Depot.")
-            return
+        name = item.data(Qt.UserRole)
 
         del self.locations[name]
-        self.refresh_list()
+        self._edited = True
+        # Drop just this row instead of rebuilding the whole list.
+        self.list_widget.takeItem(self.list_widget.row(item))
 
     # ------------------------------------------------------------------
     def lookup_address(self):
-    # Use geopy Nominatim to convert an address/postcode into latitude/longitude. Makes the dialog user-friendly.
+    # Use ORS geocoding to convert an address/postcode into latitude/longitude. Makes the dialog user-friendly.
+    # The HTTP request runs on a QThreadPool thread so the dialog keeps repainting while we wait.
 
         query = self.search_edit.text().strip()
         if not query:
-            QMessageBox.warning(self, "No input", "Please enter a postcode or location.")
+            QMessageBox.warning(self, *self._MSG_NO_QUERY)
             return
 
-        # ORS key
-        ORS_KEY = "eyJvcmciOiI1YjNjZTM1OTc4NTExMTAwMDFjZjYyNDgiLCJpZCI6IjE5YzI4NjBkYWEzMDQwZmRhODkyYmIzNGM2N2IzMDJjIiwiaCI6Im11cm11cjY0In0="
+        geocoder = _get_geocoder()
 
-        geocoder = Geocoder(ORS_KEY)
-        try:
-            result = geocoder.geocode(query)
-        except RuntimeError as e:
-            QMessageBox.critical(self, "ORS Error", str(e))
-            return
+        self.search_button.setEnabled(False)
+        self._geocode_query = query
+        self._geocode_task = BackgroundTask(geocoder.geocode, query)
+        self._geocode_task.signals.finished.connect(self._on_geocode_result)
+        self._geocode_task.signals.error.connect(self._on_geocode_error)
+        QThreadPool.globalInstance().start(self._geocode_task)
+
+    def _on_geocode_result(self, result):
+        # Runs on the GUI thread once the background lookup has finished.
+        self.search_button.setEnabled(True)
+        self._geocode_task = None
 
         if result is None:
-            QMessageBox.warning(self, "Not found",
-                                "ORS could not find a match for that text.\n"
-                                "Try a more specific address or postcode.")
+            QMessageBox.warning(self, *self._MSG_NOT_FOUND)
             return
 
         lat, lon = result
         self.lat_edit.setText(str(lat))
         self.lon_edit.setText(str(lon))
+        self.lat_edit.setProperty("value", float(lat))
+        self.lon_edit.setProperty("value", float(lon))
 
         # Autofill name if empty
         if not self.name_edit.text().strip():
-            self.name_edit.setText(query)
+            self.name_edit.setText(self._geocode_query)
+
+    def _on_geocode_error(self, message: str):
+        # Network / API errors raised by Geocoder.geocode (bad key, quota, ...).
+        self.search_button.setEnabled(True)
+        self._geocode_task = None
+        QMessageBox.critical(self, "ORS Error", message)
+
+    # ------------------------------------------------------------------
+    def _request_suggestions(self):
+        # Debounce timer fired: fetch suggestions for the current search text.
+        text = self.search_edit.text().strip()
+        if len(text) < 3 or self._suggest_task is not None:
+            return  # too short to be useful, or _on_suggestions will re-check
+
+        self._suggest_task = BackgroundTask(_get_geocoder().autocomplete, text)
+        self._suggest_task.signals.finished.connect(
+            lambda suggestions: self._on_suggestions(text, suggestions))
+        # Suggestions are best effort: errors just mean no popup
+        self._suggest_task.signals.error.connect(
+            lambda _message: setattr(self, "_suggest_task", None))
+        QThreadPool.globalInstance().start(self._suggest_task)
+
+    def _on_suggestions(self, text: str, suggestions: list):
+        # Runs on the GUI thread with (label, lat, lon) suggestions for text.
+        self._suggest_task = None
+        if self.search_edit.text().strip() != text:
+            self._suggest_timer.start()  # typed on meanwhile, fetch again
+            return
+
+        self._suggest_model.setStringList([label for label, _lat, _lon in suggestions])
+        if suggestions and self.search_edit.hasFocus():
+            self.search_edit.completer().complete()
+
+    # ------------------------------------------------------------------
+    def geocode_bulk(self):
+    # Geocode every line of the bulk box in parallel and add the hits to the working copy.
+    # Wall time is roughly the slowest lookup rather than the sum of them.
+
+        # Dedupe on the geocoder's cache key, keeping the first spelling
+        queries: Dict[str, str] = {}
+        for line in self.bulk_edit.toPlainText().splitlines():
+            query = line.strip()
+            if query and query not in self.locations:
+                queries.setdefault(normalize_query(query), query)
+
+        if not queries:
+            QMessageBox.warning(self, *self._MSG_NO_BULK_INPUT)
+            return
+
+        geocoder = _get_geocoder()
+        pool = _get_bulk_pool()
+
+        self.bulk_button.setEnabled(False)
+        self._bulk_failed = []
+        session = self._bulk_session
+        for query in queries.values():
+            task = BackgroundTask(geocoder.geocode, query)
+            task.signals.finished.connect(
+                lambda result, q=query, t=task: self._on_bulk_result(session, t, q, result))
+            task.signals.error.connect(
+                lambda message, q=query, t=task: self._on_bulk_result(session, t, q, None))
+            self._bulk_tasks[query] = task
+            pool.start(task)
+
+    def _end_bulk_session(self):
+        # Forget the bulk lookups still in flight: their results belong to
+        # an editing session that is over (accepted or reset).
+        self._bulk_session += 1
+        self._stale_bulk_tasks.update(self._bulk_tasks.values())
+        self._bulk_tasks.clear()
+        self._bulk_failed = []
+        self.bulk_button.setEnabled(True)
+
+    def _on_bulk_result(self, session: int, task, query: str, result):
+        # Runs on the GUI thread as each bulk lookup completes.
+        if session != self._bulk_session:
+            self._stale_bulk_tasks.discard(task)
+            return
+        self._bulk_tasks.pop(query, None)
+
+        if result is None:
+            self._bulk_failed.append(query)
+        elif query not in self.locations:
+            lat, lon = result
+            self.locations[query] = Location(query, lat, lon)
+            self.list_widget.addItem(self._make_item(query))
+            self._edited = True
+
+        if self._bulk_tasks:
+            return
+
+        # Last one in: keep only the lines that still need attention
+        self.bulk_button.setEnabled(True)
+        self.bulk_edit.setPlainText("\n".join(self._bulk_failed))
+        if self._bulk_failed:
+            QMessageBox.warning(self, "Some lookups failed",
+                                "ORS could not geocode:\n" + "\n".join(self._bulk_failed))
 
     # ------------------------------------------------------------------
     def accept(self):
         # When OK is pressed:
         # - If a new location is entered, validate and add it.
-        # - Deletions have already been applied.
+        # - Publish the working copy's adds / deletes.
+        # Browsing and closing (nothing typed, nothing deleted) skips both.
         name = self.name_edit.text().strip()
-        lat_text = self.lat_edit.text().strip()
-        lon_text = self.lon_edit.text().strip()
 
         if name:
             if name in self.locations:
-                QMessageBox.warning(self, "Name exists", "That name already exists.")
+                QMessageBox.warning(self, *self._MSG_NAME_EXISTS)
                 return
             try:
-                lat = float(lat_text)
-                lon = float(lon_text)
+                lat = self._coordinate(self.lat_edit)
+                lon = self._coordinate(self.lon_edit)
             except ValueError:
-                QMessageBox.warning(self, "Invalid", "Latitude and Longitude must be numbers.")
+                QMessageBox.warning(self, *self._MSG_INVALID_COORDS)
                 return
 
             self.locations[name] = Location(name, lat, lon)
+            self._edited = True
 
+        if self._edited:
+            self._commit()
+        self._end_bulk_session()
         super().accept()
 
+    @property
+    def changed(self) -> bool:
+        # True if accept() added or removed anything.
+        return bool(self.added or self.removed)
+
+    def _commit(self):
+        # Publish the difference between the working copy and the controller's
+        # dict. A name deleted and then re-added with new coordinates counts
+        # as both removed and added (removals are emitted first).
+        self.removed = [
+            n for n, loc in self._committed.items() if self.locations.get(n) is not loc
+        ]
+        self.added = [
+            n for n, loc in self.locations.items() if self._committed.get(n) is not loc
+        ]
+
+        for n in self.removed:
+            self.locationRemoved.emit(n)
+        for n in self.added:
+            self.locationAdded.emit(self.locations[n])
+
 
 # =====================================================================
 # MainWindow – two-tab dashboard
@@ -215,86 +821,174 @@ class MainWindow(QMainWindow):
     # Receives a RouteOptimizerApp instance from main.py->handles algorithm execution & stores current locations.
     # GUI is responsible only for showing controls, triggering app.run(mode), displaying results and maps, running benchmark_algorithms for evaluation
 
+    # Pretty algorithm names for display
+    _FRIENDLY_NAMES = {
+        "nn": "Nearest Neighbour",
+        "nn_2opt": "Nearest Neighbour + 2-opt",
+        "bf": "Brute Force TSP",
+    }
+    # Theoretical time/space complexities for your report
+    _COMPLEXITIES = {
+        "nn": "Time: O(n²), Space: O(n)",
+        "nn_2opt": "Time: O(n²) + local search (~O(n²·k)), Space: O(n)",
+        "bf": "Time: O(n! · n), Space: O(n)",
+    }
+
+    # Minimum seconds between streamed progress bar repaints (~25 Hz)
+    _PROGRESS_INTERVAL = 0.04
+
     def __init__(self, app_controller):
         super().__init__()
-        # Simple professional light theme
-        self.setStyleSheet("""
-        QMainWindow {
-            background-color: #f5f5f7;
-        }
-
-        QTabBar::tab {
-            padding: 6px 16px;
-            font-weight: 500;
-        }
-
-        QTabBar::tab:selected {
-            background-color: #ffffff;
-            border-bottom: 2px solid #3f51b5;
-        }
-
-        QLabel#MainTitle {
-            font-size: 22px;
-            font-weight: 700;
-        }
-
-        QPushButton {
-            background-color: #3f51b5;
-            color: white;
-            border-radius: 4px;
-            padding: 6px;
-        }
-
-        QPushButton:hover {
-            background-color: #5c6bc0;
-        }
-
-        QPushButton:disabled {
-            background-color: #b0bec5;
-        }
-
-        QTextEdit {
-            background-color: #ffffff;
-            border: 1px solid #d0d0d0;
-            border-radius: 4px;
-        }
-        """)
+        self.setStyleSheet(_MAIN_QSS)
         self.app = app_controller  # RouteOptimizerApp instance
 
         self.setWindowTitle("Delivery Route Optimizer — PyQt5 GUI")
         self.setMinimumSize(1500, 1000)
-        self.setStyleSheet("QMainWindow { background-color: #eeeeee; }")
 
         # Widgets that we need to access from multiple methods
-        self.output_box: QTextEdit | None = None
+        self.output_box: QPlainTextEdit | None = None
         self.map_view: QWebEngineView | None = None
         self.eval_graph_label: QLabel | None = None
         self.eval_distance_label: QLabel | None = None
+        self.eval_results_box: QPlainTextEdit | None = None
         self.metrics_label: QLabel | None = None
         self.progress_bar: QProgressBar | None = None
         self.current_comparison_label: QLabel | None = None
-        self.matrix_table: QTableWidget | None = None
+        self.matrix_table: QTableView | None = None
+        self.matrix_model: DistanceMatrixModel | None = None
         self.matrix_map_view: QWebEngineView | None = None
 
+        # Controller matrix (app.get_matrix) the Distance Matrix table shows;
+        # a new build means the locations changed
+        self._matrix_shown: np.ndarray | None = None
+
+        # Overlay of the current route from MapRenderer.route_overlay,
+        # None = no map yet
+        self._map_route: dict | None = None
+        # Road-path fetches in flight (kept alive until they report back),
+        # see _fetch_road_route
+        self._road_tasks: set = set()
+
+        # Map views are created on first real map (see load_map). Until then
+        # each slot holds a QLabel placeholder: view attribute -> placeholder.
+        self._map_placeholders: Dict[str, QLabel] = {}
+
+        # View attribute -> route overlay it shows; None means the "no map"
+        # message is shown. Missing = nothing loaded yet.
+        self._map_sigs: Dict[str, dict | None] = {}
+
+        # Placeholder tab widget -> function that builds its real content.
+        self.tabs: QTabWidget | None = None
+        self._lazy_tabs: Dict[QWidget, object] = {}
+
+        # Plotted values of the current_comparison.png on disk, see
+        # _generate_current_comparison_graph
+        self._cmp_key: tuple | None = None
+        self._cmp_mtime: int | None = None
+        # Persistent comparison Figure and its (time, distance) bar containers
+        self._cmp_fig = None
+        self._cmp_bars = None
+
+        # Running benchmark (BackgroundTask), None when idle
+        self._benchmark_task = None
+        # time.monotonic() of the last streamed progress repaint
+        self._last_progress_paint = 0.0
+
+        # Label -> (path, mtime, width) of the image it should end up
+        # showing, and the decodes in flight (kept alive until they report
+        # back), see _show_scaled_image.
+        self._image_requests: Dict[QLabel, tuple] = {}
+        self._image_tasks: set = set()
+
+        # Manage Locations dialog, built on first use and then reused
+        self._loc_dialog: LocationManagerDialog | None = None
+
+        # Running "Run" / "Compare" click (BackgroundTask), None when idle.
+        # At most one of them runs at a time, see _set_busy().
+        self._run_task = None
+        self.run_button: QPushButton | None = None
+        self.manage_button: QPushButton | None = None
+        self.compare_button: QPushButton | None = None
+
+        # Optimizer tab map | output splitter (sizes are remembered)
+        self.splitter: QSplitter | None = None
+
         self._setup_ui()
-        self._clear_previous_map()
+        self._restore_window_state()
         self.load_map()
 
+        # Build the shared Geocoder (HTTP session, SQLite cache) once the
+        # event loop is idle, so the first address search doesn't pay for it.
+        QTimer.singleShot(0, _get_geocoder)
+
+    # ------------------------------------------------------------------
+    def _restore_window_state(self):
+        # Reopen at the size / position / splitter layout of the last session.
+        # On first launch nothing is stored and the defaults above apply.
+        settings = QSettings("DeliveryOpt", "MainWindow")
+        geometry = settings.value("geometry")
+        if geometry is not None:
+            self.restoreGeometry(geometry)
+        splitter_state = settings.value("splitter")
+        if splitter_state is not None:
+            self.splitter.restoreState(splitter_state)
+
+    def closeEvent(self, event):
+        # Remember the window layout for the next launch.
+        settings = QSettings("DeliveryOpt", "MainWindow")
+        settings.setValue("geometry", self.saveGeometry())
+        settings.setValue("splitter", self.splitter.saveState())
+        super().closeEvent(event)
+
     # ------------------------------------------------------------------
     def _setup_ui(self):
-        # Builds the full UI: A QTabWidget with two tabs: 1. Optimizer 2. Algorithm Evaluation
+        # Builds the full UI: A QTabWidget with three tabs:
+        # 1. Optimizer 2. Algorithm Evaluation 3. Distance Matrix
+        # Only the Optimizer tab is built up front. The other two start as
+        # empty placeholders and are built (graphs decoded, matrix computed)
+        # the first time the user opens them.
         tabs = QTabWidget()
 
         optimizer_tab = self._create_optimizer_tab()
-        evaluation_tab = self._create_evaluation_tab()
-        matrix_tab = self._create_matrix_tab()
+        evaluation_tab = self._create_lazy_tab(self._build_evaluation_tab)
+        matrix_tab = self._create_lazy_tab(self._create_matrix_tab)
 
         tabs.addTab(optimizer_tab, "Optimizer")
         tabs.addTab(evaluation_tab, "Algorithm Evaluation")
         tabs.addTab(matrix_tab, "Distance Matrix")
+        tabs.currentChanged.connect(self._on_tab_changed)
 
+        self.tabs = tabs
         self.setCentralWidget(tabs)
 
+    # ------------------------------------------------------------------
+    def _create_lazy_tab(self, builder) -> QWidget:
+        # Returns an empty container tab; builder() creates its real content
+        # on first activation (see _on_tab_changed).
+        tab = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        tab.setLayout(layout)
+        self._lazy_tabs[tab] = builder
+        return tab
+
+    def _on_tab_changed(self, index: int):
+        # Build a lazy tab's content the first time it is shown, then let
+        # load_map freeze / wake the map pages that just left / entered view
+        # and bring the shown one up to date.
+        tab = self.tabs.widget(index)
+        builder = self._lazy_tabs.pop(tab, None)
+        if builder is not None:
+            tab.layout().addWidget(builder())
+        self.load_map()
+
+    def _build_evaluation_tab(self) -> QWidget:
+        # Lazy builder for the Evaluation tab: create the widgets, then show
+        # any graphs left over from an earlier benchmark run.
+        content = self._create_evaluation_tab()
+        self._load_evaluation_graph()
+        return content
+
     # ------------------------------------------------------------------
     def _create_optimizer_tab(self) -> QWidget:
         # Creates the first tab: main optimizer dashboard.
@@ -317,22 +1011,17 @@ class MainWindow(QMainWindow):
         left_widget.setLayout(left_layout)
 
         # Design header
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        logo_path = os.path.join(base_dir, "logo.png")
-
         icon = QLabel()
-        pixmap = QPixmap(logo_path)
+        pixmap = _logo_pixmap()
 
         if pixmap.isNull():
-            print("WARNING: Could not load logo from", logo_path)
+            print("WARNING: Could not load logo from", LOGO_PATH)
         else:
-            icon.setPixmap(
-                pixmap.scaled(200, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            icon.setPixmap(pixmap)
 
         title = QLabel("Delivery Route Optimizer")
         title.setFont(QFont("Segoe UI", 24, QFont.Bold))
-        title.setStyleSheet("color: #2E86C1;")
+        title.setObjectName("AppTitle")
 
         header = QHBoxLayout()
         header.setContentsMargins(0, 0, 0, 0)
@@ -351,14 +1040,14 @@ class MainWindow(QMainWindow):
         controls_box.setLayout(controls_layout)
 
         algo_label = QLabel("Select Algorithm:")
-        algo_label.setStyleSheet("font-weight: bold; font-size: 18px;")
+        algo_label.setObjectName("SectionLabel")
         controls_layout.addWidget(algo_label)
 
         self.algo_select = QComboBox()
         self.algo_select.addItem("Nearest Neighbour", "nn")
         self.algo_select.addItem("Nearest Neighbour + 2-opt", "nn_2opt")
         self.algo_select.addItem("Brute Force TSP", "bf")
-        self.algo_select.setStyleSheet("background-color: lightgray; height: 25px;")
+        self.algo_select.setObjectName("AlgoSelect")
         controls_layout.addWidget(self.algo_select)
 
         # Buttons row
@@ -369,16 +1058,19 @@ class MainWindow(QMainWindow):
         buttons_row.setLayout(buttons_layout)
 
         run_button = QPushButton("Run")
-        run_button.setStyleSheet("font-size: 18px; background-color: steelblue;")
+        run_button.setObjectName("ActionButton")
         run_button.clicked.connect(self.run_selected_algorithm)
+        self.run_button = run_button
 
         manage_button = QPushButton("Manage Locations")
-        manage_button.setStyleSheet("font-size: 18px; background-color: steelblue;")
+        manage_button.setObjectName("ActionButton")
         manage_button.clicked.connect(self.manage_locations)
+        self.manage_button = manage_button
 
         compare_button = QPushButton("Compare All Algorithms")
-        compare_button.setStyleSheet("font-size: 18px; background-color: steelblue;")
+        compare_button.setObjectName("ActionButton")
         compare_button.clicked.connect(self.compare_all_algorithms)
+        self.compare_button = compare_button
 
         buttons_layout.addWidget(run_button)
         buttons_layout.addWidget(manage_button)
@@ -395,7 +1087,7 @@ class MainWindow(QMainWindow):
         map_header.setLayout(map_header_layout)
 
         map_label = QLabel("Route Map:")
-        map_label.setStyleSheet("font-weight: bold; font-size: 18px; margin: opx; padding: 0px;")
+        map_label.setObjectName("SectionLabel")
         map_label.setMaximumHeight(25)
 
         self.progress_bar = QProgressBar()
@@ -404,7 +1096,7 @@ class MainWindow(QMainWindow):
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setMaximumHeight(18)
         self.progress_bar.setMinimumHeight(10)
-        self.progress_bar.setStyleSheet("margin: 0px; padding: 0px;")
+        self.progress_bar.setObjectName("MapProgress")
         self.progress_bar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
         # put label left, bar right
@@ -416,11 +1108,7 @@ class MainWindow(QMainWindow):
 
         left_layout.addWidget(map_header)
 
-        self.map_view = QWebEngineView()
-        self.map_view.setStyleSheet(
-            "border: 1px solid #cccccc; background-color: white;"
-        )
-        left_layout.addWidget(self.map_view)
+        left_layout.addWidget(self._create_map_placeholder("map_view"))
 
         splitter.addWidget(left_widget)
 
@@ -433,16 +1121,15 @@ class MainWindow(QMainWindow):
 
         # Metrics box
         metrics_title = QLabel("Algorithm Metrics:")
-        metrics_title.setStyleSheet("font-weight: bold;")
+        metrics_title.setObjectName("PanelTitle")
         right_layout.addWidget(metrics_title)
 
         self.metrics_label = QLabel()
         self.metrics_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         self.metrics_label.setWordWrap(True)
-        self.metrics_label.setStyleSheet(
-            "background-color: #E8F1FA; border: 1px solid #cccccc; "
-            "border-radius: 4px; padding: 6px; font-size: 18px;"
-        )
+        # Metrics are plain text; skip QLabel's rich-text detection on every update.
+        self.metrics_label.setTextFormat(Qt.PlainText)
+        self.metrics_label.setObjectName("MetricsPanel")
         self.metrics_label.setMinimumHeight(150)
         self.metrics_label.setText(
             "Run an algorithm to see its metrics here "
@@ -452,21 +1139,23 @@ class MainWindow(QMainWindow):
 
         # Detailed text output
         output_label = QLabel("Detailed Output:")
-        output_label.setStyleSheet("font-weight: bold; margin-top: 4px;")
+        output_label.setObjectName("PanelTitle")
         right_layout.addWidget(output_label)
 
-        self.output_box = QTextEdit()
+        # Plain-text widget: the output is only ever plain diagnostic lines,
+        # so skip QTextEdit's rich-text detection and HTML document layout.
+        self.output_box = QPlainTextEdit()
+        self.output_box.setObjectName("OutputBox")
         self.output_box.setReadOnly(True)
         self.output_box.setMinimumHeight(200)
-        self.output_box.setFontPointSize(9)
-        self.output_box.setStyleSheet(
-            "background-color: #ffffff; border: 1px solid #d0d0d0; border-radius: 4px;"
-        )
+        font = self.output_box.font()
+        font.setPointSize(9)
+        self.output_box.setFont(font)
         right_layout.addWidget(self.output_box)
 
         # Mini comparison graph
         comparison_title = QLabel("Current Algorithm Comparison:")
-        comparison_title.setStyleSheet("font-weight: bold; margin-top: 8px;")
+        comparison_title.setObjectName("PanelTitle")
         right_layout.addWidget(comparison_title)
 
         self.current_comparison_label = QLabel(
@@ -474,9 +1163,7 @@ class MainWindow(QMainWindow):
         )
         self.current_comparison_label.setAlignment(Qt.AlignCenter)
         self.current_comparison_label.setMinimumHeight(200)
-        self.current_comparison_label.setStyleSheet(
-            "background-color: #fafafa; border: 1px solid #cccccc; border-radius: 0px;"
-        )
+        self.current_comparison_label.setObjectName("ComparisonPreview")
         right_layout.addWidget(self.current_comparison_label)
 
         splitter.addWidget(right_widget)
@@ -485,6 +1172,7 @@ class MainWindow(QMainWindow):
         # left (= map) wide, right (= output + metrics) narrower
         splitter.setStretchFactor(0, 1)
         splitter.setStretchFactor(1, 1)
+        self.splitter = splitter
 
         layout.addWidget(splitter)
         return tab
@@ -500,7 +1188,7 @@ class MainWindow(QMainWindow):
         tab.setLayout(layout)
 
         title = QLabel("Algorithm Evaluation")
-        title.setStyleSheet("font-size: 22px; font-weight: bold;")
+        title.setObjectName("MainTitle")
         layout.addWidget(title)
 
         desc = QLabel(
@@ -508,13 +1196,38 @@ class MainWindow(QMainWindow):
             "Click 'Generate Evaluation Graph' to run timed experiments on increasing problem sizes and update the charts."
         )
         desc.setWordWrap(True)
-        desc.setStyleSheet("font-size:18px;")
+        desc.setObjectName("TabDescription")
         layout.addWidget(desc)
 
-        generate_button = QPushButton("Generate Evaluation Graph")
-        generate_button.setStyleSheet("background-color: lightblue; font-size: 18px; font-color: white;")
-        generate_button.clicked.connect(self.generate_evaluation_graph)
-        layout.addWidget(generate_button)
+        self.eval_generate_button = QPushButton("Generate Evaluation Graph")
+        self.eval_generate_button.setObjectName("SecondaryButton")
+        self.eval_generate_button.clicked.connect(self.generate_evaluation_graph)
+        layout.addWidget(self.eval_generate_button)
+
+        # Rendering the charts is optional: unticked, the benchmark only
+        # measures (results are listed in the box below either way).
+        self.render_chart_checkbox = QCheckBox("Render chart")
+        self.render_chart_checkbox.setChecked(True)
+        self.render_chart_checkbox.setObjectName("TabOption")
+        layout.addWidget(self.render_chart_checkbox)
+
+        # Benchmark progress (one step per problem size)
+        self.eval_progress_bar = QProgressBar()
+        self.eval_progress_bar.setRange(0, 100)
+        self.eval_progress_bar.setValue(0)
+        self.eval_progress_bar.setTextVisible(False)
+        self.eval_progress_bar.setMaximumHeight(18)
+        layout.addWidget(self.eval_progress_bar)
+
+        # Measured times / distances per problem size, as a text table
+        self.eval_results_box = QPlainTextEdit()
+        self.eval_results_box.setObjectName("OutputBox")
+        self.eval_results_box.setReadOnly(True)
+        # Monospaced, so the table columns line up
+        self.eval_results_box.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.eval_results_box.setPlaceholderText("Measurements appear here after a benchmark run.")
+        self.eval_results_box.setMaximumHeight(160)
+        layout.addWidget(self.eval_results_box)
 
         # --- Side-by-side graph layout ------------------------------------
 
@@ -529,7 +1242,7 @@ class MainWindow(QMainWindow):
         left_graph_box.setSpacing(6)
 
         time_title = QLabel("Execution Time vs Nodes:")
-        time_title.setStyleSheet("font-weight: bold; font-size: 18px;")
+        time_title.setObjectName("SectionLabel")
         left_graph_box.addWidget(time_title)
 
         self.eval_graph_label = QLabel("No graph yet.\n Click 'Generate Evaluation Graph' above")
@@ -542,7 +1255,7 @@ class MainWindow(QMainWindow):
         right_graph_box.setSpacing(6)
 
         dist_title = QLabel("Route Distance vs Nodes:")
-        dist_title.setStyleSheet("font-weight: bold; font-size: 18px;")
+        dist_title.setObjectName("SectionLabel")
         right_graph_box.addWidget(dist_title)
 
         self.eval_distance_label = QLabel("No graph yet.\n Click 'Generate Evaluation Graph' above")
@@ -560,27 +1273,27 @@ class MainWindow(QMainWindow):
 
     # ------------------------------------------------------------------------------------
     def _create_matrix_tab(self) -> QWidget:
-        # Creates the Distance Matrix tab showing geodesic distances between all locations.
+        # Creates the Distance Matrix tab showing great-circle distances between all locations.
         tab = QWidget()
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(10)
         tab.setLayout(layout)
 
-        title = QLabel("Distance Matrix (Geodesic)")
-        title.setStyleSheet("font-size: 22px; font-weight: bold;")
+        title = QLabel("Distance Matrix (Great-circle)")
+        title.setObjectName("MainTitle")
         layout.addWidget(title)
 
         desc = QLabel(
-            "This table shows straight-line (geodesic) distances between all locations currently defined in the problem.\n"
-            "It matches the weights used by the algorithms. (Note: customer 1-4 are default customers)"
+            "This table shows straight-line (great-circle) distances between all locations currently defined in the problem.\n"
+            "These are the same edge weights the algorithms use. (Note: customer 1-4 are default customers)"
         )
         desc.setWordWrap(True)
-        desc.setStyleSheet("font-size:18px;")
+        desc.setObjectName("TabDescription")
         layout.addWidget(desc)
 
         refresh_button = QPushButton("Refresh Matrix")
-        refresh_button.setStyleSheet("background-color: lightblue; font-size: 18px;")
+        refresh_button.setObjectName("SecondaryButton")
         refresh_button.clicked.connect(self.refresh_distance_matrix)
         layout.addWidget(refresh_button)
 
@@ -592,79 +1305,152 @@ class MainWindow(QMainWindow):
         container.setLayout(v_layout)
 
         # Top: distance matrix table
-        self.matrix_table = QTableWidget()
+        self.matrix_model = DistanceMatrixModel(self)
+        self.matrix_table = QTableView()
+        self.matrix_table.setModel(self.matrix_model)
         self.matrix_table.setMinimumHeight(250)
         v_layout.addWidget(self.matrix_table)
 
         # Bottom: map view (same HTML as main map)
-        self.matrix_map_view = QWebEngineView()
-        self.matrix_map_view.setStyleSheet(
-            "border: 1px solid #cccccc; background-color: white;"
-        )
-        self.matrix_map_view.setMinimumHeight(350)
-        v_layout.addWidget(self.matrix_map_view)
+        matrix_map_placeholder = self._create_map_placeholder("matrix_map_view")
+        matrix_map_placeholder.setMinimumHeight(350)
+        v_layout.addWidget(matrix_map_placeholder)
 
         layout.addWidget(container)
 
-        # Populate once initially
+        # Populate once initially; the map is loaded by _on_tab_changed
+        # once the tab is on screen.
         self.refresh_distance_matrix()
-        # Load current map (if any) into both maps
-        self.load_map()
 
         return tab
 
     def refresh_distance_matrix(self):
         # Rebuild the distance matrix table from current locations.
+        # Skipped when the table already shows exactly these locations.
         if self.matrix_table is None:
             return
 
-        locations = self.app.get_locations()
-        names = list(locations.keys())
-
-        n = len(names)
-        self.matrix_table.clear()
-        self.matrix_table.setRowCount(n)
-        self.matrix_table.setColumnCount(n)
-        self.matrix_table.setHorizontalHeaderLabels(names)
-        self.matrix_table.setVerticalHeaderLabels(names)
-
-        for i, name_i in enumerate(names):
-            for j, name_j in enumerate(names):
-                if i == j:
-                    text = "0.000"
-                else:
-                    loc_i = locations[name_i].as_tuple
-                    loc_j = locations[name_j].as_tuple
-                    d_km = geodesic(loc_i, loc_j).km
-                    text = f"{d_km:.3f}"
-                item = QTableWidgetItem(text)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.matrix_table.setItem(i, j, item)
+        names, dist = self.app.get_matrix()
+        if dist is self._matrix_shown:
+            return
+
+        # The view reads cells straight from the array (one model reset)
+        self.matrix_model.set_matrix(names, dist)
+        self._matrix_shown = dist
 
     # ------------------------------------------------------------------
-    def _clear_previous_map(self):
-    # Remove any old nearest_delivery.html so the app starts with a blank map message instead of a stale route.
-        map_path = os.path.abspath("nearest_delivery.html")
-        if os.path.exists(map_path):
-            os.remove(map_path)
+    def _create_map_view(self) -> QWebEngineView:
+        # Web view for the folium map, backed by the shared off-the-record profile.
+        view = QWebEngineView()
+        view.setPage(QWebEnginePage(_map_profile(), view))
+        view.setObjectName("MapFrame")
+        return view
+
+    def _create_map_placeholder(self, attr: str) -> QLabel:
+        # Lightweight stand-in for the map view stored in self.<attr>.
+        # QWebEngineView starts a Chromium render process as soon as it is
+        # constructed, so the real view is only created once there is a map.
+        placeholder = QLabel("No map generated yet. Run an algorithm first.")
+        placeholder.setAlignment(Qt.AlignCenter)
+        placeholder.setObjectName("MapFrame")
+        self._map_placeholders[attr] = placeholder
+        return placeholder
+
+    def _materialize_map_view(self, attr: str) -> QWebEngineView:
+        # Swap the placeholder for self.<attr> with a real QWebEngineView.
+        placeholder = self._map_placeholders.pop(attr)
+        view = self._create_map_view()
+        view.setMinimumHeight(placeholder.minimumHeight())
+        placeholder.parentWidget().layout().replaceWidget(placeholder, view)
+        placeholder.deleteLater()
+        setattr(self, attr, view)
+        return view
 
     # ------------------------------------------------------------------
     def load_map(self):
-        # Load the folium-generated map HTML into the QWebEngineView.
+        # Show the current route (self._map_route) in the map views.
         # If no map exists yet, show an instructional message.
-        map_path = os.path.abspath("nearest_delivery.html")
+        # The views themselves are created here, the first time a map exists.
+        #
+        # Only views on the current tab are updated; the others are frozen
+        # and catch up when their tab is shown. A view gets the full folium
+        # page (in memory, via setHtml) only when it has no route page yet;
+        # after that later routes are swapped in with the page's
+        # updateRoute(), so Chromium gets a few KB of JSON instead of
+        # re-parsing Leaflet, tiles and every marker.
+        self._sync_map_lifecycle()
+        route = self._map_route
         no_map_html = "<h3>No map generated yet. Run an algorithm first.</h3>"
+        page_html = None
 
-        views = [self.map_view, self.matrix_map_view]
+        for attr in ("map_view", "matrix_map_view"):
+            if attr in self._map_sigs and self._map_sigs[attr] is route:
+                continue
+            if not self._map_slot_shown(attr):
+                continue
 
-        for view in views:
+            view = getattr(self, attr)
             if view is None:
-                continue
+                if route is None or attr not in self._map_placeholders:
+                    continue  # the placeholder already says "no map yet"
+                view = self._materialize_map_view(attr)
 
-            if not os.path.exists(map_path):
+            if route is None:
                 view.setHtml(no_map_html)
+            elif self._map_sigs.get(attr) is not None:
+                self._push_route(view, route)
+            else:
+                if page_html is None:
+                    page_html = self.app.map_renderer.render_page(route)
+                # Folium pulls Leaflet from CDNs; a base URL gives the page
+                # a real origin to load them from.
+                view.setHtml(page_html, _MAP_BASE_URL)
+            self._map_sigs[attr] = route
+
+    def _push_route(self, view: QWebEngineView, route: dict):
+        # Swap the route inside the map page the view already shows. If the
+        # page has not defined updateRoute yet (still loading), load the
+        # full page instead - unless a newer route has replaced this one.
+        def done(updated):
+            if not updated and self._map_route is route:
+                view.setHtml(self.app.map_renderer.render_page(route), _MAP_BASE_URL)
+
+        view.page().runJavaScript(self.app.map_renderer.update_script(route), done)
+
+    def _map_slot_shown(self, attr: str) -> bool:
+        # True if the map view (or its placeholder) for self.<attr> is on
+        # the current tab.
+        widget = getattr(self, attr) or self._map_placeholders.get(attr)
+        current = self.tabs.currentWidget() if self.tabs is not None else None
+        return (widget is not None and current is not None
+                and current.isAncestorOf(widget))
+
+    def _sync_map_lifecycle(self):
+        # A hidden QWebEngineView's Chromium page keeps running timers and
+        # compositing frames. Freeze the pages whose tab is not shown and
+        # make the visible one Active again. Lifecycle states need Qt 5.14;
+        # on older Qt the hidden tab widget is at least not painted.
+        if not hasattr(QWebEnginePage, "LifecycleState"):
+            return
+        for attr in ("map_view", "matrix_map_view"):
+            view = getattr(self, attr)
+            if view is None:
+                continue
+            if self._map_slot_shown(attr):
+                state = QWebEnginePage.Active
             else:
-                view.load(QUrl.fromLocalFile(map_path))
+                state = QWebEnginePage.Frozen
+            page = view.page()
+            if page.lifecycleState() != state:
+                page.setLifecycleState(state)
+
+    # ------------------------------------------------------------------
+    def _set_busy(self, busy: bool):
+        # While an algorithm runs on a worker: no second Run / Compare (they
+        # would skew each other's timings), and no location edits (the
+        # algorithm reads the shared locations dict).
+        for button in (self.run_button, self.compare_button, self.manage_button):
+            button.setEnabled(not busy)
 
     # ------------------------------------------------------------------
     def run_selected_algorithm(self):
@@ -675,29 +1461,47 @@ class MainWindow(QMainWindow):
         # - Displays route, distance, and execution time in the output box.
         # - Updates the Algorithm Metrics panel.
         # - Reloads the map to show the new route.
+        #
+        # The run itself (BF is O(n!·n)) happens on a worker thread; results
+        # are shown in _on_run_finished, with a straight-line map that
+        # _fetch_road_route later upgrades to the road path.
+        if self._run_task is not None:
+            return  # a run is already in progress, ignore repeat clicks
 
         mode = self.algo_select.currentData()  # "nn", "nn_2opt", "bf"
 
+        self._set_busy(True)
+
         # Start progress bar at 25% when the user clicks Run
         if self.progress_bar:
             self.progress_bar.setRange(0, 100)
             self.progress_bar.setValue(25)
             self.progress_bar.show()
-            QApplication.processEvents()
 
-        result = self.app.run(mode)  # controller in main.py
+        self._run_task = BackgroundTask(self.app.run, mode)  # controller in main.py
+        self._run_task.signals.finished.connect(self._on_run_finished)
+        self._run_task.signals.error.connect(
+            lambda message: self._on_run_finished(RunResult(mode, error=message)))
+        QThreadPool.globalInstance().start(self._run_task)
+
+    def _on_run_finished(self, result: RunResult):
+        # Runs on the GUI thread once app.run(mode) has returned.
+        self._run_task = None
+        self._set_busy(False)
 
-        if result.get("error"):
-            QMessageBox.critical(self, "Error", result["error"])
+        mode = result.mode
+
+        if result.error:
+            QMessageBox.critical(self, "Error", result.error)
             if self.progress_bar:
                 self.progress_bar.setValue(0)
             return
 
-        route_list = result.get("route") or []
+        route_list = result.route
         route_str = " → ".join(route_list) if route_list else "(no route)"
-        distance = result.get("distance")
-        exec_time = result.get("exec_time")
-        stats = result.get("stats") or {}
+        distance = result.distance
+        exec_time = result.exec_time
+        stats = result.stats
 
         # ---------- Detailed text output (right-hand text area) ----------
         text_lines = [
@@ -705,46 +1509,30 @@ class MainWindow(QMainWindow):
             f"Route: {route_str}",
         ]
         if distance is not None:
-            text_lines.append(f"Total Distance (geodesic): {distance:.3f} km")
+            text_lines.append(f"Total Distance (great-circle): {distance:.3f} km")
         if exec_time is not None:
             text_lines.append(f"Execution Time (measured): {exec_time * 1000:.2f} ms")
 
         # ---------- NEW: edge-by-edge distances along the route ----------
         if route_list and len(route_list) > 1:
-            locations = self.app.get_locations()
             text_lines.append("")  # blank line
-            text_lines.append("Edge distances (geodesic):")
+            text_lines.append("Edge distances (great-circle):")
 
+            # The same matrix the algorithms used, so edges add up to the total
+            names, dist = self.app.get_matrix()
+            idx = {name: i for i, name in enumerate(names)}
             for i in range(len(route_list) - 1):
                 a = route_list[i]
                 b = route_list[i + 1]
-
-                # Get (lat, lon) for each location
-                loc_a = locations[a].as_tuple
-                loc_b = locations[b].as_tuple
-
-                d_km = geodesic(loc_a, loc_b).km
+                d_km = dist[idx[a], idx[b]]
                 text_lines.append(f"{a} → {b}: {d_km:.3f} km")
 
-        self.output_box.setText("\n".join(text_lines))
+        self.output_box.setPlainText("\n".join(text_lines))
 
         # ---------- Algorithm metrics panel (right-hand metrics box) -----
         if self.metrics_label is not None:
-            # Pretty algorithm names for display
-            friendly_names = {
-                "nn": "Nearest Neighbour",
-                "nn_2opt": "Nearest Neighbour + 2-opt",
-                "bf": "Brute Force TSP",
-            }
-            # Theoretical time/space complexities for your report
-            complexities = {
-                "nn": "Time: O(n²), Space: O(n)",
-                "nn_2opt": "Time: O(n²) + local search (~O(n²·k)), Space: O(n)",
-                "bf": "Time: O(n! · n), Space: O(n)",
-            }
-
-            friendly = friendly_names.get(mode, mode)
-            complexity = complexities.get(mode, "Unknown complexity")
+            friendly = self._FRIENDLY_NAMES.get(mode, mode)
+            complexity = self._COMPLEXITIES.get(mode, "Unknown complexity")
             node_count = len(route_list) - 1 if route_list else 0  # minus duplicate depot
 
             metrics_lines = [
@@ -756,7 +1544,7 @@ class MainWindow(QMainWindow):
             if exec_time is not None:
                 metrics_lines.append(f"Measured runtime: {exec_time * 1000:.2f} ms")
             if distance is not None:
-                metrics_lines.append(f"Route length (geodesic): {distance:.3f} km")
+                metrics_lines.append(f"Route length (great-circle): {distance:.3f} km")
 
             # Algorithm specific stats
             if mode in ("nn", "nn_2opt"):
@@ -796,45 +1584,93 @@ class MainWindow(QMainWindow):
         if self.progress_bar:
             self.progress_bar.setValue(100)
 
-        # ---------- Reload map for the new route -------------------------
+        # ---------- Show the new route on the map ------------------------
+        if result.map_route:
+            self._map_route = result.map_route
+            self._fetch_road_route(route_list, result.map_route)
+        self.load_map()
+
+    def _fetch_road_route(self, route: list[str], straight: dict):
+        # Ask ORS for the road-following path of a route whose straight-line
+        # overlay is on the map, on the road-fetch thread (_get_road_pool)
+        # so neither the results nor the GUI wait for the network. Locations
+        # are snapshotted: they can be edited again while the request is out.
+        task = BackgroundTask(self.app.map_renderer.route_overlay,
+                              route, dict(self.app.get_locations()))
+        task.signals.finished.connect(
+            lambda overlay, t=task: self._on_road_route(t, straight, overlay))
+        task.signals.error.connect(
+            lambda message, t=task: self._road_tasks.discard(t))
+        self._road_tasks.add(task)
+        _get_road_pool().start(task)
+
+    def _on_road_route(self, task, straight: dict, overlay: dict | None):
+        # Runs on the GUI thread when a fetch from _fetch_road_route is done.
+        # Ignored if another route (or none) is on the map by now, or if
+        # ORS failed and only the straight lines came back.
+        self._road_tasks.discard(task)
+        if self._map_route is not straight or overlay is None:
+            return
+        if overlay["path"] == straight["path"]:
+            return
+        self._map_route = overlay
         self.load_map()
 
     # ------------------------------------------------------------------
     def manage_locations(self):
         # Open the Manage Locations dialog.
-        # After the dialog closes with OK, update the controller's locations.
-        #
-        # Note: The locations dict is shared by reference with the dialog, so changes are already applied;
-        # we just tell the controller to use the updated dict.
+        # On OK the dialog emits one signal per added / removed location,
+        # which go straight to the controller's add_location / remove_location.
         locations = self.app.get_locations()
-        dlg = LocationManagerDialog(locations, self)
-        if dlg.exec_():
-            # Apply updated locations to controller
-            self.app.update_locations(locations)
-            self.output_box.append("\n[Locations updated]")
-            # Clear previous map because route is now outdated
-            self._clear_previous_map()
-            self.load_map()
+        dlg = self._loc_dialog
+        if dlg is None:
+            dlg = self._loc_dialog = LocationManagerDialog(locations, self)
+            dlg.locationAdded.connect(self.app.add_location)
+            dlg.locationRemoved.connect(self.app.remove_location)
+        else:
+            dlg.reset(locations)
 
-            self.refresh_distance_matrix()
+        if dlg.exec_():
+            if dlg.changed:
+                self.output_box.appendPlainText("\n[Locations updated]")
+                # Clear previous map because route is now outdated
+                self._map_route = None
+                self.load_map()
+                self.refresh_distance_matrix()
 
     # ------------------------------------------------------------------
     def compare_all_algorithms(self):
         # Run NN, NN+2opt, and BF on the current locations and show
         # a textual summary + a mini comparison graph.
+        #
+        # The three runs happen one after another on a worker thread, not in
+        # parallel: they are CPU-bound Python, so parallel threads would only
+        # contend for the GIL and inflate each other's measured times.
+        if self._run_task is not None:
+            return
+
+        self._set_busy(True)
         if self.progress_bar:
             self.progress_bar.setRange(0, 100)
             self.progress_bar.show()
-            QApplication.processEvents()
 
-        try:
-            results = self.app.run_all()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-            if self.progress_bar:
-                self.progress_bar.setRange(0, 100)
-                self.progress_bar.setValue(0)
-            return
+        self._run_task = BackgroundTask(self.app.run_all)
+        self._run_task.signals.finished.connect(self._on_compare_finished)
+        self._run_task.signals.error.connect(self._on_compare_error)
+        QThreadPool.globalInstance().start(self._run_task)
+
+    def _on_compare_error(self, message: str):
+        self._run_task = None
+        self._set_busy(False)
+        QMessageBox.critical(self, "Error", message)
+        if self.progress_bar:
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(0)
+
+    def _on_compare_finished(self, results: Dict[str, RunResult]):
+        # Runs on the GUI thread once app.run_all() has returned.
+        self._run_task = None
+        self._set_busy(False)
 
         # Reset / clear the metrics box because this view is about comparison,
         # not a single algorithm's detailed stats.
@@ -852,11 +1688,11 @@ class MainWindow(QMainWindow):
                  ("bf", "Brute Force TSP")]
 
         for mode, name in order:
-            res = results.get(mode, {})
-            route = res.get("route") or []
-            dist = res.get("distance")
-            t = res.get("exec_time")
-            stats = res.get("stats") or {}
+            res = results.get(mode) or RunResult(mode)
+            route = res.route
+            dist = res.distance
+            t = res.exec_time
+            stats = res.stats
 
             lines.append("")
             lines.append(f"{name} ({mode}):")
@@ -877,7 +1713,7 @@ class MainWindow(QMainWindow):
                 lines.append(f"  Permutations tested: {stats.get('permutations_tested', 0)}")
 
         if self.output_box:
-            self.output_box.setText("\n".join(lines))
+            self.output_box.setPlainText("\n".join(lines))
 
         if self.progress_bar:
             self.progress_bar.setValue(60)
@@ -885,11 +1721,8 @@ class MainWindow(QMainWindow):
         # Generate the mini comparison graph
         try:
             img_path = self._generate_current_comparison_graph(results)
-            if self.current_comparison_label and os.path.exists(img_path):
-                from PyQt5.QtGui import QPixmap
-                self.current_comparison_label.setPixmap(
-                    QPixmap(img_path).scaledToWidth(400, Qt.SmoothTransformation)
-                )
+            if self.current_comparison_label:
+                self._show_scaled_image(self.current_comparison_label, img_path, 400)
         except Exception as e:
             # If graph generation fails, don't crash the app
             if self.current_comparison_label:
@@ -907,6 +1740,10 @@ class MainWindow(QMainWindow):
         NN, NN+2opt, and BF on the current locations.
 
         Returns the absolute path to the saved PNG.
+
+        The chart is a pure function of the plotted values, so when they are
+        unchanged (at the precision shown in the summary) and the PNG is
+        still there, it is reused instead of rendered and encoded again.
         """
         # Prepare data
         modes = ["nn", "nn_2opt", "bf"]
@@ -915,44 +1752,67 @@ class MainWindow(QMainWindow):
         dists = []
 
         for mode in modes:
-            res = results.get(mode, {})
-            t = res.get("exec_time") or 0.0
-            d = res.get("distance") or 0.0
+            res = results.get(mode) or RunResult(mode)
+            t = res.exec_time or 0.0
+            d = res.distance or 0.0
             times.append(t)
             dists.append(d)
 
-        # Avoid zero-division if times are all 0
-        # (will just plot zeros - fine for small instances)
-        import numpy as np
-
-        x = np.arange(len(labels))  # 0,1,2
-        width = 0.35
-
-        plt.figure(figsize=(6, 4))
-
-        # Time bars on left, distance on right (scaled)
-        plt.subplot(2, 1, 1)
-        plt.bar(labels, [t * 1000 for t in times])
-        plt.ylabel("Time (ms)")
-        plt.title("Execution Time by Algorithm")
+        # Saved into the gui folder. One stat tells whether the PNG we wrote
+        # last is still the one on disk.
+        img_path = COMPARISON_PNG
+        key = (tuple(round(t * 1000, 2) for t in times),
+               tuple(round(d, 3) for d in dists))
+        if key == self._cmp_key and _image_mtime(img_path) == self._cmp_mtime:
+            return img_path
+
+        # One figure is built on first use and kept: later calls only move
+        # the bar heights and rescale, skipping axes / font / renderer setup.
+        if self._cmp_fig is None:
+            self._cmp_fig, self._cmp_bars = self._create_comparison_figure(labels)
+        fig = self._cmp_fig
+        time_bars, dist_bars = self._cmp_bars
+
+        for bar, t in zip(time_bars, times):
+            bar.set_height(t * 1000)
+        for bar, d in zip(dist_bars, dists):
+            bar.set_height(d)
+        for ax in fig.axes:
+            ax.relim()
+            ax.autoscale_view()
+        fig.tight_layout()
+
+        fig.savefig(img_path)
+
+        self._cmp_key = key
+        self._cmp_mtime = _image_mtime(img_path)
+        return img_path
 
-        plt.subplot(2, 1, 2)
-        plt.bar(labels, dists)
-        plt.ylabel("Distance (km)")
-        plt.title("Route Distance by Algorithm")
+    @staticmethod
+    def _create_comparison_figure(labels: list):
+        # Figure for the comparison chart: time bars on top, distance below.
+        # Returns (figure, (time_bars, distance_bars)).
+        # OO Figure API on an explicit Agg canvas rather than pyplot: we only
+        # ever write PNGs, so no interactive (Qt5Agg) backend is selected or
+        # imported, and the figure is not tracked by pyplot's global registry.
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
 
-        plt.tight_layout()
+        # 6 in at 400/6 dpi = 400 px wide: saved at exactly the preview size,
+        # so showing it needs no resample pass.
+        fig = Figure(figsize=(6, 4), dpi=400 / 6)
+        FigureCanvasAgg(fig)
+        ax_time, ax_dist = fig.subplots(2, 1)
 
-        # Save into gui folder
-        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        gui_dir = os.path.join(root_dir, "gui")
-        os.makedirs(gui_dir, exist_ok=True)
-        img_path = os.path.join(gui_dir, "current_comparison.png")
+        time_bars = ax_time.bar(labels, [0.0] * len(labels))
+        ax_time.set_ylabel("Time (ms)")
+        ax_time.set_title("Execution Time by Algorithm")
 
-        plt.savefig(img_path)
-        plt.close()
+        dist_bars = ax_dist.bar(labels, [0.0] * len(labels))
+        ax_dist.set_ylabel("Distance (km)")
+        ax_dist.set_title("Route Distance by Algorithm")
 
-        return img_path
+        return fig, (time_bars, dist_bars)
 
     # -------------------------------------------------------------------------------
     def _load_evaluation_graph(self):
@@ -961,49 +1821,126 @@ class MainWindow(QMainWindow):
         # This is helpful if the user has already run the benchmark in a
         # previous session or earlier in this session.
 
-        # Project root
-        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        gui_dir = os.path.join(root_dir, "gui")
+        if self.eval_graph_label:
+            self._show_scaled_image(self.eval_graph_label, EXECUTION_TIME_PNG, 450)
 
-        time_path = os.path.join(gui_dir, "execution_time.png")
-        dist_path = os.path.join(gui_dir, "execution_distance.png")
-
-        if self.eval_graph_label and os.path.exists(time_path):
-            self.eval_graph_label.setPixmap(
-                QPixmap(time_path).scaledToWidth(450, Qt.SmoothTransformation)
-            )
+        if self.eval_distance_label:
+            self._show_scaled_image(self.eval_distance_label, EXECUTION_DISTANCE_PNG, 450)
 
-        if self.eval_distance_label and os.path.exists(dist_path):
-            self.eval_distance_label.setPixmap(
-                QPixmap(dist_path).scaledToWidth(450, Qt.SmoothTransformation)
-            )
+    def _show_scaled_image(self, label: QLabel, path: str, width: int):
+        # Show the PNG at path in label, scaled to width. The decode runs on
+        # the thread pool; the label keeps its current content until it is
+        # done. Does nothing if the file does not exist.
+        mtime = _image_mtime(path)
+        if mtime is None:
+            return
+        key = (path, mtime, width)
+        self._image_requests[label] = key
+
+        task = BackgroundTask(_load_scaled_image, *key)
+        task.signals.finished.connect(
+            lambda image, t=task: self._on_scaled_image(t, label, key, image))
+        task.signals.error.connect(
+            lambda message, t=task: self._image_tasks.discard(t))
+        self._image_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_scaled_image(self, task, label: QLabel, key: tuple, image: QImage):
+        # Runs on the GUI thread when a decode from _show_scaled_image is
+        # done. A label that has since been asked to show something else
+        # ignores the late result.
+        self._image_tasks.discard(task)
+        if self._image_requests.get(label) != key:
+            return
+        del self._image_requests[label]
+        if not image.isNull():
+            label.setPixmap(QPixmap.fromImage(image))
 
     # ------------------------------------------------------------------
     def generate_evaluation_graph(self):
         # Called when the user presses the 'Generate Evaluation Graph' button.
         #
-        # Runs the benchmarking routine and updates BOTH graphs:
+        # Runs the benchmarking routine on a worker thread (BF at several
+        # sizes can take seconds) and updates BOTH graphs when it finishes:
         #     - time graph
         #     - distance graph
-        locations = self.app.get_locations()
-        try:
-            paths = benchmark_algorithms(locations)  # now returns dict
-        except Exception as e:
-            QMessageBox.critical(self, "Benchmark error", str(e))
-            return
+        if self._benchmark_task is not None:
+            return  # a benchmark is already running
 
-        time_path = paths.get("time")
-        dist_path = paths.get("distance")
+        from src.utils.benchmark import benchmark_algorithms
 
-        if self.eval_graph_label and time_path and os.path.exists(time_path):
-            self.eval_graph_label.setPixmap(
-                QPixmap(time_path).scaledToWidth(600, Qt.SmoothTransformation)
-            )
+        # Snapshot: the benchmark must not see edits made while it runs.
+        locations = dict(self.app.get_locations())
+        generate_graphs = self.render_chart_checkbox.isChecked()
 
-        if self.eval_distance_label and dist_path and os.path.exists(dist_path):
-            self.eval_distance_label.setPixmap(
-                QPixmap(dist_path).scaledToWidth(600, Qt.SmoothTransformation)
-            )
+        self.eval_generate_button.setEnabled(False)
+        self.eval_progress_bar.setValue(0)
+
+        self._benchmark_task = BackgroundTask(
+            benchmark_algorithms, locations,
+            generate_graphs=generate_graphs, with_progress=True
+        )
+        self._benchmark_task.signals.progress.connect(self._on_benchmark_progress)
+        self._benchmark_task.signals.finished.connect(self._on_benchmark_finished)
+        self._benchmark_task.signals.error.connect(self._on_benchmark_error)
+        QThreadPool.globalInstance().start(self._benchmark_task)
+
+    def _on_benchmark_progress(self, done: int, total: int):
+        # Progress can arrive far faster than the eye (or the paint
+        # pipeline) can follow, so repaint at most every _PROGRESS_INTERVAL s.
+        # The final update always goes through.
+        now = time.monotonic()
+        if done < total and now - self._last_progress_paint < self._PROGRESS_INTERVAL:
+            return
+        self._last_progress_paint = now
+        self.eval_progress_bar.setValue(int(done * 100 / total) if total else 100)
+
+    def _on_benchmark_error(self, message: str):
+        self._benchmark_task = None
+        self.eval_generate_button.setEnabled(True)
+        self.eval_progress_bar.setValue(0)
+        QMessageBox.critical(self, "Benchmark error", message)
+
+    def _on_benchmark_finished(self, result: dict):
+        # Runs on the GUI thread once benchmark_algorithms has returned.
+        # Freshly rendered graphs come with their pixels, which are shown
+        # directly; reused ones only have a path to the PNG.
+        self._benchmark_task = None
+        self.eval_generate_button.setEnabled(True)
+        self.eval_progress_bar.setValue(100)
+
+        if self.eval_results_box is not None and result.get("nodes"):
+            self.eval_results_box.setPlainText(_format_measurements(result))
+
+        for label, key in ((self.eval_graph_label, "time"),
+                           (self.eval_distance_label, "distance")):
+            if not label:
+                continue
+            rgba = result.get(f"{key}_rgba")
+            if rgba is not None:
+                # Supersedes any decode still in flight for this label
+                self._image_requests.pop(label, None)
+                label.setPixmap(_pixmap_from_rgba(rgba, 600))
+            elif result.get(key):
+                self._show_scaled_image(label, result[key], 600)
+
+
+def _format_measurements(result: dict) -> str:
+    # Fixed-width table of benchmark_algorithms' measurements, one row per
+    # problem size: times in ms, route lengths in km.
+    times = result["times"]
+    dists = result["dists"]
+    lines = [
+        f"{'Nodes':>5}  {'NN ms':>10}  {'NN+2opt ms':>10}  {'BF ms':>10}  "
+        f"{'NN km':>9}  {'NN+2opt km':>10}  {'BF km':>9}"
+    ]
+    for i, n in enumerate(result["nodes"]):
+        lines.append(
+            f"{n:>5}  {times['nn'][i] * 1000:>10.3f}  {times['nn_2opt'][i] * 1000:>10.3f}  "
+            f"{times['bf'][i] * 1000:>10.3f}  {dists['nn'][i]:>9.3f}  "
+            f"{dists['nn_2opt'][i]:>10.3f}  {dists['bf'][i]:>9.3f}"
+        )
+    return "\n".join(lines)
 
 
 # =====================================================================
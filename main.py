@@ -7,11 +7,16 @@
 # GUI (window.py) receives a RouteOptimizerApp instance & uses its methods instead of calling free functions.
 
 
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+import time
+
+import numpy as np
 
 from src.models.location import Location
+from src.models.run_result import RunResult
 from src.algorithms.nearest_neighbour import NearestNeighbourTSP
 from src.algorithms.brute_force_tsp import BruteForceTSPSolver
+from src.utils.distance import distance_matrix
 from src.utils.map_renderer import MapRenderer
 
 
@@ -21,13 +26,19 @@ class RouteOptimizerApp:
     # Responsibilities:
     # - Maintain the current set of locations (depot + customers).
     # - Provide a simple .run(mode) API for the GUI.
-    # - Provide accessors to get / update locations (for Manage Locations).
+    # - Provide an accessor for the locations, and single-location
+    #   add / remove (for Manage Locations).
 
     def __init__(self) -> None:
         # Initialise with a default scenario
         self.locations: Dict[str, Location] = self._build_default_locations()
         self.map_renderer = MapRenderer()
 
+        # (locations key, names, distance matrix), shared by every solver and
+        # the GUI until the locations change (see get_matrix). One tuple, so
+        # threads never see a key paired with another build's matrix.
+        self._matrix_cache: Optional[Tuple[tuple, List[str], np.ndarray]] = None
+
     # ------------------------------------------------------------------
     # 1. Location management
     # ------------------------------------------------------------------
@@ -48,34 +59,44 @@ class RouteOptimizerApp:
         # Returns the current location set. Used by the GUI (MainWindow) to show / edit locations.
         return self.locations
 
-    def update_locations(self, new_locations: Dict[str, Location]) -> None:
-    # Replace the current locations with a new set. Called when the Manage Locations dialog is closed with OK.
-        self.locations = new_locations
+    def add_location(self, location: Location) -> None:
+    # Add (or replace) one location. Called per change when the Manage Locations dialog is closed with OK.
+        self.locations[location.name] = location
+
+    def remove_location(self, name: str) -> None:
+    # Remove one location by name. Called per change when the Manage Locations dialog is closed with OK.
+        self.locations.pop(name, None)
+
+    def get_matrix(self) -> Tuple[List[str], np.ndarray]:
+    # (names, great-circle km matrix) of the current locations, in dict order: row / column i is names[i].
+    # Rebuilt only when a name or coordinate changed, so run(), the three modes of run_all() and the GUI's route output / Distance Matrix tab reuse one build.
+        cache = self._matrix_cache
+        key = tuple(
+            (name, loc.latitude, loc.longitude)
+            for name, loc in self.locations.items()
+        )
+        if cache is None or cache[0] != key:
+            cache = (key, list(self.locations), distance_matrix(list(self.locations.values())))
+            self._matrix_cache = cache
+        return cache[1], cache[2]
 
     # ------------------------------------------------------------------
     # 2. Algorithm execution API (what the GUI calls)
     # ------------------------------------------------------------------
-    def run(self, mode: str) -> dict:
+    def run(self, mode: str) -> RunResult:
         # Public method the GUI calls to run one of the algorithms.
         return self._run_algorithm_on_current_locations(mode, render_map=True)
 
     # ------------------------------------------------------------------
     # 3. Internal algorithm method (pure logic)
     # ------------------------------------------------------------------
-    def _run_algorithm_on_current_locations(self, mode: str, render_map: bool=True) -> dict:
+    def _run_algorithm_on_current_locations(self, mode: str, render_map: bool=True) -> RunResult:
     # Contains the actual algorithm logic.
     # This is a *private* helper used by .run(), so the GUI only sees one clean method in the public API.
         locations = self.locations
         start = "Depot"
 
-        result = {
-            "mode": mode,
-            "route": None,
-            "distance": None,
-            "exec_time": None,
-            "error": None,
-            "stats": {},
-        }
+        result = RunResult(mode)
 
         try:
             if "Depot" not in locations:
@@ -83,24 +104,22 @@ class RouteOptimizerApp:
 
             # ----- NEAREST NEIGHBOUR / NN + 2-opt ---------------------
             if mode in ("nn", "nn_2opt"):
-                algo = NearestNeighbourTSP(locations)
+                algo = NearestNeighbourTSP(locations, self.get_matrix()[1])
                 algo.reset_stats()
 
-                import time
-                t0 = time.perf_counter()
+                t0 = time.perf_counter_ns()
                 nn_route, nn_distance = algo.nearest_neighbour(start)
-                t1 = time.perf_counter()
+                t1 = time.perf_counter_ns()
 
                 if mode == "nn":
                     final_route = nn_route
                     final_distance = nn_distance
-                    exec_time = t1 - t0
+                    exec_time = (t1 - t0) / 1e9
                     improvement_pct = None
                 else:
-                    t2 = time.perf_counter()
                     final_route, final_distance = algo.two_opt(nn_route)
-                    t3 = time.perf_counter()
-                    exec_time = t3 - t0  # NN + 2-opt
+                    t2 = time.perf_counter_ns()
+                    exec_time = (t2 - t0) / 1e9  # NN + 2-opt, in seconds
 
                     # Percentage improvement of NN+2opt from NN
                     if nn_distance > 0:
@@ -117,39 +136,42 @@ class RouteOptimizerApp:
 
             # ----- BRUTE FORCE ----------------------------------------
             elif mode == "bf":
-                import time
-                bf_solver = BruteForceTSPSolver(locations)
+                bf_solver = BruteForceTSPSolver(locations, self.get_matrix()[1])
                 bf_solver.reset_stats()
 
-                t0 = time.perf_counter()
+                t0 = time.perf_counter_ns()
                 final_route, final_distance = bf_solver.solve(start)
-                t1 = time.perf_counter()
-                exec_time = t1 - t0
+                t1 = time.perf_counter_ns()
+                exec_time = (t1 - t0) / 1e9
 
                 stats = bf_solver.get_stats()
 
             else:
                 raise ValueError(f"Unknown algorithm mode: {mode}")
 
-            result["route"] = final_route
-            result["distance"] = final_distance
-            result["exec_time"] = exec_time
-            result["stats"] = stats
+            result.route = final_route
+            result.distance = final_distance
+            result.exec_time = exec_time
+            result.stats = stats
 
-            # Draw the map with whatever route we got
+            # Draw the map with whatever route we got. Straight lines only:
+            # the result must not wait on ORS, so the road-following path
+            # is fetched separately (the GUI swaps it in when it arrives).
             if render_map:
-                self.map_renderer.render_route(final_route, locations)
+                result.map_route = self.map_renderer.route_overlay(
+                    final_route, locations, roads=False
+                )
 
         except Exception as e:
-            result["error"] = str(e)
+            result.error = str(e)
 
         return result
 
-    def run_all(self) -> dict:
+    def run_all(self) -> Dict[str, RunResult]:
         # Run NN, NN+2opt, and BF on the current locations.
         # Map is NOT redrawn here; this is purely for stats/comparison.
         modes = ("nn", "nn_2opt", "bf")
-        results = {}
+        results: Dict[str, RunResult] = {}
 
         for mode in modes:
             results[mode] = self._run_algorithm_on_current_locations(
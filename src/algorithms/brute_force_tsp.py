@@ -4,11 +4,21 @@
 # - BruteForceTSPSolver: encapsulates the brute-force logic.
 # - brute_force_tsp(...): helper wrapper function for backwards compatibility.
 
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
 from itertools import permutations
+from math import factorial
+import multiprocessing
+
+import numpy as np
 
-from geopy.distance import geodesic
 from src.models.location import Location
+from src.utils.distance import distance_matrix
+
+# Tour positions enumerated inside one NumPy batch: 7! = 5040 orders of
+# the last 7 stops per shared prefix. Large enough that the per-batch
+# Python overhead vanishes, small enough that the gather arrays stay small.
+_SUFFIX_LEN = 7
 
 
 class BruteForceTSPSolver:
@@ -16,20 +26,38 @@ class BruteForceTSPSolver:
     #
     # Tries all possible permutations of the customer nodes and finds
     # the shortest complete loop route starting and ending at the depot.
-
-    def __init__(self, locations: Dict[str, Location]):
+    #
+    # All edge weights are computed once up front (one vectorized haversine
+    # pass) into a matrix indexed by position in self._names. The (n-1)!
+    # permutations are then scored in NumPy batches that share a prefix
+    # (see _best_tour), so the per-permutation work runs in C instead of
+    # the interpreter and each prefix's length is summed only once.
+    #
+    # On request (max_workers > 1) the search is split by first stop across
+    # worker processes (see _best_tour_parallel). It is off by default: the
+    # GUI solves from a thread-pool thread of a Qt process, and at the
+    # sizes brute force is usable for, starting and importing into the
+    # workers costs about as much as the search itself.
+
+    def __init__(self, locations: Dict[str, Location],
+                 matrix: Optional[np.ndarray] = None,
+                 max_workers: Optional[int] = None):
+        # matrix: precomputed (n, n) distance matrix in the order of
+        # `locations` (see src.utils.distance.distance_matrix); built here if None.
+        # max_workers: worker processes to split the search across; None or
+        # 1 (the default) keeps it in-process.
         self.locations = locations
+        self.max_workers = max_workers
+
+        self._names: List[str] = list(locations.keys())
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        if matrix is None:
+            matrix = distance_matrix(list(locations.values()))
+        self._matrix: np.ndarray = matrix
 
         # Stats for analysis / GUI metrics
         self.distance_calls = 0
-        self.permutations_texted = 0
-
-    def _distance(self, a: str, b: str) -> float:
-        self.distance_calls += 1
-        # Compute straight-line distance between two nodes, in km.
-        loc1 = self.locations[a].as_tuple
-        loc2 = self.locations[b].as_tuple
-        return geodesic(loc1, loc2).km
+        self.permutations_tested = 0
 
     def solve(self, start: str) -> Tuple[List[str], float]:
         self.reset_stats()
@@ -38,22 +66,26 @@ class BruteForceTSPSolver:
         if start not in self.locations:
             raise ValueError(f"Start node '{start}' not found.")
 
-        others = [name for name in self.locations.keys() if name != start]
-
-        best_route = []
-        best_distance = float("inf")
+        s = self._index[start]
+        others = [i for i in range(len(self._names)) if i != s]
+        if not others:
+            return [start, start], 0.0
 
-        for perm in permutations(others):
-            route = [start] + list(perm) + [start]
-            total = 0.0
+        workers = min(len(others), self.max_workers or 1)
 
-            for i in range(len(route) - 1):
-                total += self._distance(route[i], route[i + 1])
+        if workers > 1:
+            best_perm, best_distance = _best_tour_parallel(
+                self._matrix, s, others, workers
+            )
+        else:
+            best_perm, best_distance = _best_tour(self._matrix, s, others)
 
-            if total < best_distance:
-                best_distance = total
-                best_route = route
+        # Every permutation scores len(others) + 1 edges
+        self.permutations_tested = factorial(len(others))
+        self.distance_calls = self.permutations_tested * (len(others) + 1)
 
+        names = self._names
+        best_route = [start] + [names[i] for i in best_perm] + [start]
         return best_route, best_distance
 
     def reset_stats(self):
@@ -69,11 +101,94 @@ class BruteForceTSPSolver:
         }
 
 
+def _best_tour(d: np.ndarray, start: int, others: Sequence[int],
+               head: Tuple[int, ...] = ()) -> Tuple[Tuple[int, ...], float]:
+    # Score every order of `others` as a loop start -> head -> ... -> start
+    # over the distance matrix d, and return the shortest (order including
+    # head, length). `head` is a fixed run of first stops, not in `others`.
+    #
+    # Module-level so it can be pickled into a worker process.
+    #
+    # Tours are split into a prefix (the first m - k stops) and a suffix
+    # (the last k = min(m, _SUFFIX_LEN) stops). The length of each prefix
+    # is computed once and shared by all k! tours that start with it; the
+    # suffixes are scored together in NumPy from one precomputed table of
+    # position orders, so no Python code runs per tour.
+    # Prefixes and suffixes are both enumerated in lexicographic order, so
+    # tours are visited in itertools.permutations order and, as only a
+    # strictly shorter tour replaces the best, ties keep the first found.
+    m = len(others)
+    k = min(m, _SUFFIX_LEN)
+    # (k!, k) orders of the k suffix slots
+    suffix_orders = np.array(list(permutations(range(k))), dtype=np.intp)
+    rows = d.tolist()  # scalar lookups for the prefixes
+
+    head_last = start
+    head_length = 0.0
+    for node in head:
+        head_length += rows[head_last][node]
+        head_last = node
+
+    best_perm: Tuple[int, ...] = head + tuple(others)
+    best_length = float("inf")
+
+    for prefix in permutations(others, m - k):
+        last = head_last
+        prefix_length = head_length
+        for node in prefix:
+            prefix_length += rows[last][node]
+            last = node
+
+        # Remaining stops in ascending order, then every order of them
+        used = set(prefix)
+        rest = np.array([i for i in others if i not in used], dtype=np.intp)
+        tails = rest[suffix_orders]
+
+        lengths = prefix_length + d[last, tails[:, 0]] + d[tails[:, -1], start]
+        if k > 1:
+            lengths += d[tails[:, :-1], tails[:, 1:]].sum(axis=1)
+
+        j = int(lengths.argmin())
+        if lengths[j] < best_length:
+            best_length = float(lengths[j])
+            best_perm = head + prefix + tuple(tails[j].tolist())
+
+    return best_perm, best_length
+
+
+def _best_tour_parallel(d: np.ndarray, start: int, others: Sequence[int],
+                        workers: int) -> Tuple[Tuple[int, ...], float]:
+    # _best_tour split across processes: tours are grouped by their first
+    # stop, giving len(others) independent searches of (m-1)! tours each.
+    # The groups are reduced in ascending first-stop order with a strict
+    # comparison, so ties resolve exactly as in the serial search.
+    #
+    # Workers are spawned, never forked: forking a multi-threaded process
+    # (Qt, QtWebEngine, the thread pool) can deadlock the child.
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [
+            pool.submit(_best_tour, d, start,
+                        [i for i in others if i != first], (first,))
+            for first in others
+        ]
+
+        best_perm: Tuple[int, ...] = tuple(others)
+        best_length = float("inf")
+        for future in futures:
+            perm, length = future.result()
+            if length < best_length:
+                best_perm, best_length = perm, length
+
+    return best_perm, best_length
+
+
 # ----------------------------------------------------------------------
 # Backwards-compatible wrapper
 # ----------------------------------------------------------------------
-def brute_force_tsp(locations: Dict[str, Location], start: str):
+def brute_force_tsp(locations: Dict[str, Location], start: str,
+                    max_workers: Optional[int] = None):
     # Keeps the old API alive, so existing import statements keep working.
     # Internally creates BruteForceTSPSolver and calls solve().
-    solver = BruteForceTSPSolver(locations)
+    solver = BruteForceTSPSolver(locations, max_workers=max_workers)
     return solver.solve(start)
@@ -8,10 +8,15 @@
 # by passing in a dictionary of Location objects.
 
 
-from typing import Dict, List, Tuple
-from geopy.distance import geodesic
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from src.models.location import Location
+from src.utils.distance import distance_matrix
+
+# Smallest length reduction (km) for which 2-opt takes a move
+_MIN_GAIN = 1e-9
 
 
 class NearestNeighbourTSP:
@@ -20,15 +25,30 @@ class NearestNeighbourTSP:
     # The algorithm itself is completely independent of maps, folium,
     # and OpenRouteService – it only needs access to coordinates.
 
-    def __init__(self, locations: Dict[str, Location]):
+    def __init__(self, locations: Dict[str, Location],
+                 matrix: Optional[np.ndarray] = None):
         # Parameters
         # ----------
         # locations : dict[str, Location]
         #     Mapping from location name -> Location object.
         #     Example keys: 'Depot', 'Customer1', 'Customer2', ...
+        # matrix : np.ndarray or None
+        #     Precomputed (n, n) distance matrix in the order of `locations`
+        #     (see src.utils.distance.distance_matrix); built here if None.
 
         self.locations = locations
 
+        # Edge weights, computed once: the heuristic and 2-opt re-read the
+        # same pairs many times. Indexed by position in self._names; the
+        # ndarray serves whole-row (vectorized) reads, the nested-list copy
+        # single-pair lookups (faster than indexing an ndarray from Python).
+        self._names: List[str] = list(locations.keys())
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        if matrix is None:
+            matrix = distance_matrix(list(locations.values()))
+        self._matrix: np.ndarray = matrix
+        self._rows: List[List[float]] = self._matrix.tolist()
+
         # Stats for analysis / GUI metrics
         self.distance_calls = 0
         self.two_opt_swaps_considered = 0
@@ -43,12 +63,10 @@ class NearestNeighbourTSP:
         # This is the edge weight used by the Nearest Neighbour heuristic
         # and by the 2-opt improvement step.
         #
-        # Currently: geodesic (great-circle) distance in kilometres.
+        # Currently: haversine (great-circle) distance in kilometres, looked
+        # up in the precomputed matrix.
         self.distance_calls += 1
-
-        loc1 = self.locations[name1].as_tuple   # (lat, lon)
-        loc2 = self.locations[name2].as_tuple
-        return geodesic(loc1, loc2).km
+        return self._rows[self._index[name1]][self._index[name2]]
 
     # ------------------------------------------------------------------
     # Basic Nearest Neighbour from a single start
@@ -72,38 +90,39 @@ class NearestNeighbourTSP:
 
         self.reset_stats()
 
-        current = start
-        route: List[str] = [current]
-        total_distance = 0.0
+        names = self._names
+        d = self._matrix
+        s = self._index[start]
+
+        # Unvisited locations as a boolean mask over matrix rows
+        unvisited = np.ones(len(names), dtype=bool)
+        unvisited[s] = False
 
-        # Build the list of unvisited locations (everything except start)
-        unvisited: List[str] = [
-            name for name in self.locations.keys() if name != start
-        ]
+        current = s
+        order: List[int] = [s]
+        total_distance = 0.0
 
         # While there are still locations to visit ...
-        while unvisited:
-            # Assume the first unvisited is nearest for now
-            nearest = unvisited[0]
-            nearest_distance = self._distance(current, nearest)
-
-            # Check all remaining unvisited locations
-            for name in unvisited:
-                d = self._distance(current, name)
-                if d < nearest_distance:
-                    nearest = name
-                    nearest_distance = d
+        for remaining in range(len(names) - 1, 0, -1):
+            # Nearest unvisited location in one pass over the current row;
+            # visited ones are masked out with inf. argmin returns the first
+            # minimum, so ties go to the earliest location as before.
+            row = np.where(unvisited, d[current], np.inf)
+            nearest = int(row.argmin())
+            self.distance_calls += remaining
 
             # Move to the nearest location found
-            route.append(nearest)
-            total_distance += nearest_distance
+            order.append(nearest)
+            total_distance += float(row[nearest])
+            unvisited[nearest] = False
             current = nearest
-            unvisited.remove(nearest)
 
         # Return to start (Depot) to complete the loop
-        route.append(start)
-        total_distance += self._distance(current, start)
+        total_distance += self._rows[current][s]
+        self.distance_calls += 1
 
+        route = [names[i] for i in order]
+        route.append(start)
         return route, total_distance
 
     # ------------------------------------------------------------------
@@ -122,55 +141,83 @@ class NearestNeighbourTSP:
         # - If the new route is shorter, keep it.
         # - Repeat until no further improvement is found.
         #
-        # Complexity: roughly O(n^2) per pass for n nodes,
-        # but for small n (your assignment) it's very manageable.
+        # Complexity: roughly O(n^2) candidate moves per pass for n nodes,
+        # each checked in O(1): reversing route[i..k] only replaces the two
+        # edges (A-B), (C-D) with (A-C), (B-D), so the change in length is
+        # known without building or re-measuring the new route. The route
+        # is handled as matrix indices and only reversed (in place) for a
+        # move that is actually taken.
+        #
+        # Don't-look bits (Bentley): after the first pass, a move is only
+        # checked if one of its four endpoints had an edge changed in the
+        # previous pass - moves between untouched edges were already found
+        # useless. A pass that finds nothing this way is followed by one
+        # full, unpruned pass, so the result is still 2-opt optimal.
+        # Improving moves are taken as they are found and the pass carries
+        # on, instead of restarting from the start of the route.
 
         if len(route) < 4:
             # Not enough nodes to improve
             return route, self._total_route_distance(route)
 
-        best_route = route[:]
-        best_distance = self._total_route_distance(best_route)
-        improved = True
+        d = self._rows
+        tour = [self._index[name] for name in route]
+        considered_before = self.two_opt_swaps_considered
+        all_active = [True] * len(self._names)
+        active = all_active
 
-        while improved:
+        while True:
             improved = False
+            touched = [False] * len(self._names)
 
             # i and k are the start and end indices of the segment to reverse
             # We avoid index 0 and the last index (they are both 'Depot').
-            for i in range(1, len(best_route) - 2):
-                for k in range(i + 1, len(best_route) - 1):
+            for i in range(1, len(tour) - 2):
+                a = tour[i - 1]
+                b = tour[i]
+                row_a = d[a]
+                row_b = d[b]
+                ab = row_a[b]
+                ab_active = active[a] or active[b]
+                for k in range(i + 1, len(tour) - 1):
+                    c = tour[k]
+                    e = tour[k + 1]
+                    if not (ab_active or active[c] or active[e]):
+                        continue
+
                     # count every candidate swap we consider
                     self.two_opt_swaps_considered += 1
+                    delta = row_a[c] + row_b[e] - ab - d[c][e]
 
-                    new_route = self._two_opt_swap(best_route, i, k)
-                    new_distance = self._total_route_distance(new_route)
-
-                    if new_distance < best_distance:
-                        best_route = new_route
-                        best_distance = new_distance
+                    # The tolerance keeps float noise from being taken as a
+                    # gain (and from cycling between equal-length routes)
+                    if delta < -_MIN_GAIN:
+                        tour[i:k + 1] = tour[i:k + 1][::-1]
                         # count swaps
                         self.two_opt_improvements += 1
                         improved = True
-                        # Restart the search from the beginning of the route
-                        break
-                if improved:
-                    break
-
-        return best_route, best_distance
-
-    def _two_opt_swap(self, route: List[str], i: int, k: int) -> List[str]:
-        # Returns a new route where the segment route[i:k+1] has been reversed.
-        # Example:
-        #     route = [A, B, C, D, E, F]
-        #     i = 2 (C), k = 4 (E)
-        #     -> [A, B, E, D, C, F]
-        new_route = (
-            route[0:i] +
-            list(reversed(route[i:k + 1])) +
-            route[k + 1:]
-        )
-        return new_route
+                        touched[a] = touched[b] = touched[c] = touched[e] = True
+
+                        # tour[i] is now c: continue from the new (A-B) edge
+                        b = c
+                        row_b = d[b]
+                        ab = row_a[b]
+                        ab_active = True
+
+            if improved:
+                active = touched
+            elif active is all_active:
+                break  # a full pass found nothing: 2-opt optimal
+            else:
+                active = all_active
+
+        # Four matrix reads per candidate move
+        self.distance_calls += 4 * (self.two_opt_swaps_considered - considered_before)
+
+        best_route = [self._names[i] for i in tour]
+        # Re-measured once at the end instead of summing deltas, so no
+        # rounding drift reaches the reported distance
+        return best_route, self._total_route_distance(best_route)
 
     def _total_route_distance(self, route: List[str]) -> float:
         # Compute the total distance along a particular route loop.
@@ -11,6 +11,9 @@ can use it directly in experiments / benchmarking.
 
 from typing import List, Callable
 
+# Smallest length reduction for which a move is taken
+_MIN_GAIN = 1e-9
+
 
 def two_opt(route: List[str],
             distance_fn: Callable[[str, str], float]) -> (List[str], float):
@@ -37,17 +40,20 @@ def two_opt(route: List[str],
 
     Complexity
     ----------
-    In the worst case, 2-opt is O(n^2) per pass and can run multiple
-    passes until no improvement is found. For small n (like this assignment),
-    it is perfectly acceptable and gives noticeably better routes than
-    plain nearest neighbour.
+    In the worst case, 2-opt is O(n^2) candidate moves per pass and can run
+    multiple passes until no improvement is found. Each candidate costs
+    four distance_fn calls: reversing route[i..k] only swaps the edges
+    (A-B), (C-D) for (A-C), (B-D), so the change in length is known without
+    building the new route. The route is only reversed, in place, for a
+    move that is taken. For small n (like this assignment), it is
+    perfectly acceptable and gives noticeably better routes than plain
+    nearest neighbour.
     """
     if len(route) < 4:
         # Too small to improve (need at least 3 edges in a loop)
         return route, _route_distance(route, distance_fn)
 
     best_route = route[:]
-    best_distance = _route_distance(best_route, distance_fn)
     improved = True
 
     # Continue attempting improvements until a full pass gives no gain
@@ -57,37 +63,25 @@ def two_opt(route: List[str],
         # i and k are the start and end of the segment to reverse
         # We avoid index 0 and last index (they are the same depot node)
         for i in range(1, len(best_route) - 2):
+            a = best_route[i - 1]
+            b = best_route[i]
+            ab = distance_fn(a, b)
             for k in range(i + 1, len(best_route) - 1):
-                new_route = _two_opt_swap(best_route, i, k)
-                new_distance = _route_distance(new_route, distance_fn)
+                c = best_route[k]
+                d = best_route[k + 1]
+                delta = distance_fn(a, c) + distance_fn(b, d) - ab - distance_fn(c, d)
 
-                if new_distance < best_distance:
-                    best_route = new_route
-                    best_distance = new_distance
+                # Tolerance: float noise is not an improvement
+                if delta < -_MIN_GAIN:
+                    best_route[i:k + 1] = best_route[i:k + 1][::-1]
                     improved = True
                     # Break to restart search from beginning with new route
                     break
             if improved:
                 break
 
-    return best_route, best_distance
-
-
-def _two_opt_swap(route: List[str], i: int, k: int) -> List[str]:
-    """
-    Returns a new route where the section route[i:k+1] has been reversed.
-
-    This is the fundamental 2-opt operation:
-      ... A - B ---- C - D ...
-    becomes:
-      ... A - C ---- B - D ...
-    """
-    new_route = (
-        route[0:i] +
-        list(reversed(route[i:k + 1])) +
-        route[k + 1:]
-    )
-    return new_route
+    # Measured once at the end rather than accumulated from the deltas
+    return best_route, _route_distance(best_route, distance_fn)
 
 
 def _route_distance(route: List[str],
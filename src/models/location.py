@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from typing import Tuple
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     # Represents a physical point used by the algorithms.
+    # Slotted: no per-instance __dict__, and faster attribute reads.
 
     name: str
     latitude: float
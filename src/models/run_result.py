@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+@dataclass(slots=True)
+class RunResult:
+    # Outcome of one algorithm run, returned by RouteOptimizerApp.run / run_all.
+    # Typed fields instead of a dict so a misspelt key fails loudly.
+
+    mode: str
+    route: List[str] = field(default_factory=list)
+    distance: Optional[float] = None
+    exec_time: Optional[float] = None
+    error: Optional[str] = None
+    stats: Dict[str, object] = field(default_factory=dict)
+    # Map overlay for the route (MapRenderer.route_overlay); only set when
+    # the map was rendered.
+    map_route: Optional[dict] = None
